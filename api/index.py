@@ -1,9 +1,10 @@
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify, render_template_string, stream_with_context
+import io
 import os
+import re
 import sys
-import tempfile
 import json
-from datetime import datetime
+import time
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -11,18 +12,39 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 try:
     from bank_parser import IndianBankStatementParser
 except ImportError:
-    # Fallback for deployment
-    class IndianBankStatementParser:
-        def parse_statement(self, pdf_path, password=None):
-            return {
-                'bank_name': 'Demo Bank',
-                'total_transactions': 0,
-                'transactions': [],
-                'metadata': {'account_number': 'Demo', 'parsed_at': datetime.now().isoformat()}
-            }
+    # Fallback for deployment: each bank's table is read by its header row.
+    from transaction_stream import StreamingStatementParser as IndianBankStatementParser
+
+from parse_cache import ParseCache, make_cache_key, with_cache_status
+from password_candidates import guess_password
+from job_queue import JobQueue, QueueFull
+from statement_batch import BatchError, batch_entries, parse_batch
+from transaction_batch import TransactionBatch
+from transaction_stream import ndjson_lines, result_lines
 
 app = Flask(__name__)
 
+# Accountants re-upload the same statements while reconciling; identical
+# bytes (and password) are served from here instead of being parsed again.
+parse_cache = ParseCache(
+    max_entries=int(os.environ.get('PARSE_CACHE_ENTRIES', '32')),
+    cache_dir=os.environ.get('PARSE_CACHE_DIR') or None,
+)
+
+# Rows per page of a columnar result (?format=columnar and /api/results/<id>).
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Statements in one /api/batch request are parsed across this many processes.
+BATCH_WORKERS = int(os.environ.get('PARSE_BATCH_WORKERS', str(max(1, (os.cpu_count() or 1) - 1))))
+
+# Long statements are parsed off the request thread through /api/jobs, which
+# reports pages done as a streaming parser completes them.
+job_queue = JobQueue(
+    workers=int(os.environ.get('PARSE_JOB_WORKERS', '2')),
+    max_pending=int(os.environ.get('PARSE_JOB_MAX_PENDING', '8')),
+)
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
@@ -36,11 +58,19 @@ HTML_TEMPLATE = """
         .upload-area { border: 2px dashed #ccc; padding: 40px; text-align: center; border-radius: 10px; }
         .upload-area:hover { border-color: #007bff; }
         input[type="file"] { margin: 10px 0; }
-        input[type="password"] { width: 200px; padding: 5px; margin: 10px 0; }
+        input[type="password"], input[type="text"] { width: 200px; padding: 5px; margin: 10px 0; }
         button { background: #007bff; color: white; padding: 10px 20px; border: none; border-radius: 5px; cursor: pointer; }
         button:hover { background: #0056b3; }
         .result { background: white; padding: 20px; border-radius: 10px; margin: 20px 0; }
-        .transaction { border-bottom: 1px solid #eee; padding: 10px 0; }
+        .filters { margin-bottom: 10px; }
+        .viewport { height: 480px; overflow-y: auto; position: relative; border: 1px solid #eee; }
+        .rows { position: absolute; top: 0; left: 0; right: 0; }
+        .tx-row { display: flex; height: 32px; line-height: 32px; border-bottom: 1px solid #eee; font-size: 14px; }
+        .tx-row span { padding: 0 6px; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }
+        .tx-head { font-weight: bold; cursor: pointer; text-transform: capitalize; }
+        .col-date { width: 95px; flex: none; }
+        .col-description { flex: 1; }
+        .col-debit, .col-credit, .col-balance { width: 100px; flex: none; text-align: right; }
         .error { color: red; background: #ffe6e6; padding: 10px; border-radius: 5px; }
         .success { color: green; background: #e6ffe6; padding: 10px; border-radius: 5px; }
     </style>
@@ -57,6 +87,8 @@ HTML_TEMPLATE = """
                 <br>
                 <input type="password" name="password" placeholder="PDF Password (if required)">
                 <br>
+                <input type="text" name="password_hints" placeholder="Account no., mobile, DOB, name (optional)">
+                <br>
                 <button type="submit">Parse Statement</button>
             </div>
         </form>
@@ -65,6 +97,11 @@ HTML_TEMPLATE = """
     <div id="result"></div>
     
     <script>
+        const PAGE_SIZE = 200;
+        const ROW_HEIGHT = 32;
+        const FIELDS = ['date', 'description', 'debit', 'credit', 'balance'];
+        let view = null;
+        
         document.getElementById('uploadForm').addEventListener('submit', async function(e) {
             e.preventDefault();
             
@@ -74,7 +111,7 @@ HTML_TEMPLATE = """
             resultDiv.innerHTML = '<div class="container">⏳ Processing PDF...</div>';
             
             try {
-                const response = await fetch('/api/parse', {
+                const response = await fetch(`/api/parse?format=columnar&limit=${PAGE_SIZE}`, {
                     method: 'POST',
                     body: formData
                 });
@@ -84,7 +121,7 @@ HTML_TEMPLATE = """
                 if (data.error) {
                     resultDiv.innerHTML = `<div class="error">❌ Error: ${data.error}</div>`;
                 } else {
-                    let html = `
+                    resultDiv.innerHTML = `
                         <div class="result">
                             <div class="success">✅ Successfully parsed ${data.total_transactions} transactions from ${data.bank_name} Bank</div>
                             <h3>📋 Statement Info</h3>
@@ -93,39 +130,145 @@ HTML_TEMPLATE = """
                             <p><strong>Account Number:</strong> ${data.metadata.account_number}</p>
                             
                             <h3>💳 Transactions</h3>
-                    `;
-                    
-                    data.transactions.forEach(tx => {
-                        html += `
-                            <div class="transaction">
-                                <strong>${tx.date}</strong> - ${tx.description}<br>
-                                Debit: ₹${tx.debit.toFixed(2)} | Credit: ₹${tx.credit.toFixed(2)} | Balance: ₹${tx.balance.toFixed(2)}
+                            <div class="filters">
+                                <input type="text" id="filterText" placeholder="Search descriptions">
+                                <select id="filterType">
+                                    <option value="">All</option>
+                                    <option value="debit">Debits</option>
+                                    <option value="credit">Credits</option>
+                                </select>
+                                <span id="matched"></span>
+                            </div>
+                            <div class="tx-row tx-head">
+                                ${FIELDS.map(field => `<span class="col-${field}" data-sort="${field}">${field}</span>`).join('')}
+                            </div>
+                            <div id="viewport" class="viewport">
+                                <div id="spacer"></div>
+                                <div id="rows" class="rows"></div>
                             </div>
-                        `;
-                    });
-                    
-                    html += `
                             <br>
                             <button onclick="downloadJSON()">📥 Download JSON</button>
                         </div>
                     `;
                     
-                    resultDiv.innerHTML = html;
-                    window.parsedData = data;
+                    view = {resultId: data.result_id, matched: 0, sort: '', order: 'asc', q: '', type: '', pages: new Map()};
+                    showPage(0, data);
+                    document.getElementById('viewport').addEventListener('scroll', renderRows);
+                    document.getElementById('filterText').addEventListener('input', debounce(() => {
+                        view.q = document.getElementById('filterText').value;
+                        reload();
+                    }, 250));
+                    document.getElementById('filterType').addEventListener('change', e => {
+                        view.type = e.target.value;
+                        reload();
+                    });
+                    document.querySelectorAll('.tx-head span').forEach(header => header.addEventListener('click', () => {
+                        const field = header.dataset.sort;
+                        view.order = view.sort === field && view.order === 'asc' ? 'desc' : 'asc';
+                        view.sort = field;
+                        reload();
+                    }));
                 }
             } catch (error) {
                 resultDiv.innerHTML = `<div class="error">❌ Error: ${error.message}</div>`;
             }
         });
         
-        function downloadJSON() {
-            const dataStr = JSON.stringify(window.parsedData, null, 2);
-            const dataBlob = new Blob([dataStr], {type: 'application/json'});
-            const url = URL.createObjectURL(dataBlob);
+        // Pages of rows are fetched from the server as they scroll into view;
+        // only the rows inside the viewport exist in the DOM.
+        function showPage(number, data) {
+            view.pages.set(number, data.columns);
+            view.matched = data.matched;
+            document.getElementById('spacer').style.height = `${view.matched * ROW_HEIGHT}px`;
+            document.getElementById('matched').textContent = `${view.matched} shown`;
+            renderRows();
+        }
+        
+        async function loadPage(number) {
+            if (view.pages.has(number)) return;
+            view.pages.set(number, null);
+            const current = view;
+            const params = new URLSearchParams({offset: number * PAGE_SIZE, limit: PAGE_SIZE,
+                                                sort: view.sort, order: view.order, q: view.q, type: view.type});
+            const response = await fetch(`/api/results/${view.resultId}?${params}`);
+            const data = await response.json();
+            if (current !== view) return;
+            if (data.error) {
+                document.getElementById('matched').textContent = data.error;
+                return;
+            }
+            showPage(number, data);
+        }
+        
+        function reload() {
+            view = Object.assign({}, view, {pages: new Map()});
+            document.getElementById('viewport').scrollTop = 0;
+            loadPage(0);
+        }
+        
+        function renderRows() {
+            const viewport = document.getElementById('viewport');
+            const first = Math.floor(viewport.scrollTop / ROW_HEIGHT);
+            const last = Math.min(view.matched, first + Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 1);
+            const rows = document.getElementById('rows');
+            rows.style.transform = `translateY(${first * ROW_HEIGHT}px)`;
+            rows.replaceChildren();
+            for (let i = first; i < last; i++) {
+                const columns = view.pages.get(Math.floor(i / PAGE_SIZE));
+                if (columns === undefined) loadPage(Math.floor(i / PAGE_SIZE));
+                const row = document.createElement('div');
+                row.className = 'tx-row';
+                FIELDS.forEach(field => {
+                    const cell = document.createElement('span');
+                    cell.className = `col-${field}`;
+                    if (columns) {
+                        const value = columns[field][i % PAGE_SIZE];
+                        cell.textContent = typeof value === 'number' ? `₹${value.toFixed(2)}` : value;
+                    }
+                    row.appendChild(cell);
+                });
+                rows.appendChild(row);
+            }
+        }
+        
+        function debounce(fn, wait) {
+            let timer;
+            return () => {
+                clearTimeout(timer);
+                timer = setTimeout(fn, wait);
+            };
+        }
+        
+        async function downloadJSON() {
+            const response = await fetch(`/api/results/${view.resultId}/download`);
+            if (response.ok) {
+                save(await response.blob(), 'parsed_statement.json');
+                return;
+            }
+            // The server no longer holds the result (or this request reached
+            // another instance): save the rows already loaded as CSV instead.
+            const lines = [FIELDS.join(',')];
+            [...view.pages.keys()].sort((a, b) => a - b).forEach(number => {
+                const columns = view.pages.get(number);
+                if (!columns) return;
+                columns.date.forEach((_, i) => lines.push(FIELDS.map(field => csvCell(columns[field][i])).join(',')));
+            });
+            save(new Blob([lines.join('\\n') + '\\n'], {type: 'text/csv'}), 'parsed_statement.csv');
+            document.getElementById('matched').textContent =
+                `Result expired on the server; saved the ${lines.length - 1} of ${view.matched} rows loaded as CSV`;
+        }
+        
+        function csvCell(value) {
+            const text = value === null || value === undefined ? '' : String(value);
+            return /[",\\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+        }
+        
+        function save(blob, filename) {
             const link = document.createElement('a');
-            link.href = url;
-            link.download = 'parsed_statement.json';
+            link.href = URL.createObjectURL(blob);
+            link.download = filename;
             link.click();
+            setTimeout(() => URL.revokeObjectURL(link.href), 0);
         }
     </script>
 </body>
@@ -136,41 +279,233 @@ HTML_TEMPLATE = """
 def index():
     return render_template_string(HTML_TEMPLATE)
 
+def _read_upload():
+    """``(pdf_file, filename, password)`` of the uploaded statement, or an error response.
+
+    ``pdf_file`` is the upload's own stream (a ``SpooledTemporaryFile`` once
+    it is large), not a copy of it: the cache key, the password probe and
+    the parser all read it in place and leave it rewound.
+    """
+    if 'pdf' not in request.files:
+        return None, (jsonify({'error': 'No PDF file uploaded'}), 400)
+    
+    pdf_file = request.files['pdf']
+    password = request.form.get('password', '')
+    
+    if pdf_file.filename == '':
+        return None, (jsonify({'error': 'No file selected'}), 400)
+    
+    pdf_password = password if password else None
+    source = pdf_file.stream
+    
+    # Try passwords built from the filename and any hints (account number, mobile, DOB)
+    if not pdf_password:
+        hints = request.form.get('password_hints', '').split(',')
+        pdf_password = guess_password(source, pdf_file.filename, hints)
+    return (source, pdf_file.filename, pdf_password), None
+
+def _parse_statement(source, pdf_password, progress=None):
+    # The parser opens what it is given with pdfplumber, which takes a path
+    # or a binary file object; bytes (from a batch) are wrapped, not written
+    # to a temporary file.
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    parser = IndianBankStatementParser()
+    if progress is not None and hasattr(parser, 'stream'):
+        # A streaming parser reports pages done as its StatementStream completes them.
+        return parser.parse_statement(source, password=pdf_password, progress=progress)
+    return parser.parse_statement(source, password=pdf_password)
+
+def _cache_key(source, pdf_password):
+    # Keyed by the parser in use: results of the header-row fallback are
+    # never served once bank_parser is installed, nor the other way round.
+    return make_cache_key(source, getattr(IndianBankStatementParser, 'parser_id', None), pdf_password)
+
+def _parse_upload(source, pdf_password, cache_key=None, progress=None):
+    cache_key = cache_key or _cache_key(source, pdf_password)
+    return parse_cache.get_or_parse(cache_key, lambda: _parse_statement(source, pdf_password, progress))
+
+def _wants_stream():
+    return (request.args.get('stream') == '1'
+            or request.accept_mimetypes.best == 'application/x-ndjson')
+
+def _stream_upload(source, pdf_password):
+    """NDJSON response: metadata line, one line per transaction, summary line.
+
+    The transactions are those ``/api/parse`` returns for the same upload.
+    A cached result is replayed line by line. A parser that can stream
+    (it has a ``stream`` method returning a ``StatementStream``) sends each
+    line as soon as its page completes; the request context is kept open
+    for it, so the stream reads the upload in place. Streamed parses are
+    not cached, as that would mean holding every transaction until the
+    end. Any other parser's result is parsed, cached and replayed.
+    """
+    cache_key = _cache_key(source, pdf_password)
+    cached = parse_cache.get(cache_key)
+    parser = IndianBankStatementParser()
+    if cached is not None:
+        lines = result_lines(with_cache_status(cached, 'hit'))
+    elif hasattr(parser, 'stream'):
+        lines = stream_with_context(ndjson_lines(parser.stream(source, pdf_password)))
+    else:
+        lines = result_lines(_parse_upload(source, pdf_password, cache_key))
+    return Response(lines, mimetype='application/x-ndjson')
+
 @app.route('/api/parse', methods=['POST'])
 def parse_pdf():
     try:
-        if 'pdf' not in request.files:
-            return jsonify({'error': 'No PDF file uploaded'}), 400
-        
-        pdf_file = request.files['pdf']
-        password = request.form.get('password', '')
-        
-        if pdf_file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
+        upload, error = _read_upload()
+        if error:
+            return error
+        source, _, pdf_password = upload
+        if _wants_stream():
+            return _stream_upload(source, pdf_password)
+        if request.args.get('format') == 'columnar':
+            cache_key = _cache_key(source, pdf_password)
+            return _columnar_page(cache_key, _parse_upload(source, pdf_password, cache_key))
+        return jsonify(_parse_upload(source, pdf_password))
+                
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/batch', methods=['POST'])
+def parse_batch_upload():
+    uploads = [(f.filename, f.read()) for f in request.files.getlist('pdf') if f.filename]
+    if not uploads:
+        return jsonify({'error': 'No PDF file uploaded'}), 400
+    try:
+        # {"statement.pdf": "password", ...}; files not listed are guessed
+        passwords = json.loads(request.form.get('passwords') or '{}')
+        if not isinstance(passwords, dict):
+            raise ValueError
+    except ValueError:
+        return jsonify({'error': 'passwords must be a JSON object of filename to password'}), 400
+    hints = request.form.get('password_hints', '').split(',')
+    
+    start = time.perf_counter()
+    try:
+        entries = batch_entries(uploads)
+    except BatchError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    results, jobs = [None] * len(entries), []
+    for position, (filename, pdf_bytes) in enumerate(entries):
+        # Zip members are named by their path in the archive; the map may
+        # use either that or the bare file name.
+        pdf_password = (passwords.get(filename) or passwords.get(os.path.basename(filename))
+                        or guess_password(pdf_bytes, filename, hints))
+        cache_key = _cache_key(pdf_bytes, pdf_password)
+        cached = parse_cache.get(cache_key)
+        if cached is not None:
+            results[position] = {'file': filename, 'status': 'ok', 'seconds': 0.0,
+                                 'result': with_cache_status(cached, 'hit')}
+        else:
+            jobs.append((position, cache_key, (filename, pdf_bytes, pdf_password)))
+    
+    parsed = parse_batch([job for _, _, job in jobs], _parse_statement, workers=BATCH_WORKERS)
+    for (position, cache_key, _), entry in zip(jobs, parsed):
+        if entry['status'] == 'ok':
+            parse_cache.put(cache_key, entry['result'])
+            entry['result'] = with_cache_status(entry['result'], 'miss')
+        results[position] = entry
+    
+    return jsonify({
+        'files': results,
+        'succeeded': sum(1 for entry in results if entry['status'] == 'ok'),
+        'failed': sum(1 for entry in results if entry['status'] != 'ok'),
+        'total_seconds': round(time.perf_counter() - start, 3),
+    })
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    try:
+        upload, error = _read_upload()
+        if error:
+            return error
+        source, _, pdf_password = upload
+        # The job outlives the request, and the upload's stream with it.
+        pdf_bytes = source.read()
         
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            pdf_file.save(temp_file.name)
-            temp_path = temp_file.name
+        def work(job):
+            # Same parser and cache entry as /api/parse, so a job's result is
+            # the one a direct parse of the upload would return.
+            return _parse_upload(pdf_bytes, pdf_password, progress=job.set_progress)
         
-        try:
-            parser = IndianBankStatementParser()
-            
-            # Auto-detect IDBI password from filename
-            pdf_password = password if password else None
-            if not pdf_password and 'IDBI_' in pdf_file.filename:
-                pdf_password = pdf_file.filename.split('_')[-1].replace('.PDF', '').replace('.pdf', '')
-            
-            result = parser.parse_statement(temp_path, password=pdf_password)
-            return jsonify(result)
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-                
+        job = job_queue.submit(work)
+    except QueueFull:
+        return jsonify({'error': 'Too many statements are being parsed, try again shortly'}), 503, {'Retry-After': '5'}
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    return jsonify(job.to_dict()), 202, {'Location': f'/api/jobs/{job.id}'}
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    return jsonify(job.to_dict())
+
+def _result_batch(result_id, result):
+    # Kept beside the result in the parse cache and evicted with it.
+    return parse_cache.derived(result_id, lambda: TransactionBatch.from_transactions(result.get('transactions') or []))
+
+def _missing_result(result_id):
+    # Result ids are cache keys; a well-formed one was handed out and has
+    # since been evicted, or this request reached another instance.
+    if re.fullmatch(r'[0-9a-f]{64}', result_id):
+        return jsonify({'error': 'Result expired, upload the statement again'}), 410
+    return jsonify({'error': 'Unknown result'}), 404
+
+def _columnar_page(result_id, result):
+    """One page of a parsed statement, as parallel arrays per field.
+    
+    ``offset``/``limit`` select the page, ``sort`` (a field) with
+    ``order=desc`` orders it, and ``q`` (description text), ``type``
+    (debit or credit) and ``from``/``to`` (ISO dates) filter it; the
+    filters are applied before paging, so ``matched`` counts every row
+    that passed them.
+    """
+    try:
+        offset = max(0, int(request.args.get('offset', 0)))
+        limit = min(MAX_PAGE_SIZE, max(1, int(request.args.get('limit', PAGE_SIZE))))
+    except ValueError:
+        return jsonify({'error': 'offset and limit must be integers'}), 400
+    batch = _result_batch(result_id, result)
+    indices = batch.select(
+        query=request.args.get('q') or None,
+        kind=request.args.get('type'),
+        date_from=request.args.get('from'),
+        date_to=request.args.get('to'),
+        sort=request.args.get('sort'),
+        descending=request.args.get('order') == 'desc',
+    )
+    page = indices[offset:offset + limit].tolist()
+    return jsonify({
+        'result_id': result_id,
+        'bank_name': result.get('bank_name'),
+        'total_transactions': len(batch),
+        'metadata': result.get('metadata') or {},
+        'matched': len(indices),
+        'offset': offset,
+        'limit': limit,
+        'columns': batch.columns(page),
+    })
+
+@app.route('/api/results/<result_id>', methods=['GET'])
+def result_page(result_id):
+    result = parse_cache.get(result_id)
+    if result is None:
+        return _missing_result(result_id)
+    return _columnar_page(result_id, result)
+
+@app.route('/api/results/<result_id>/download', methods=['GET'])
+def download_result(result_id):
+    result = parse_cache.get(result_id)
+    if result is None:
+        return _missing_result(result_id)
+    response = jsonify(result)
+    response.headers['Content-Disposition'] = 'attachment; filename=parsed_statement.json'
+    return response
 
 # Vercel handler
 def handler(request):
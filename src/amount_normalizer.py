@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+# Trailing balance-side markers: "9196.50 CR", "443359.49Cr", "33,816.66(Cr)".
+_SIDE_SUFFIX = r'\(?\s*(DR|CR)\.?\s*\)?$'
+# Currency markers and grouping: "INR34,279.01", "Rs. 1,00,102.03", "₹ 500".
+_NOISE = r'INR|RS\.?|₹|,|\s'
+_BLANKS = ['', '-', '--', 'NIL']
+_NUMBER = r'^([+-]?)(\d*)(?:\.(\d*))?$'
+MAX_RUPEE_DIGITS = 16
+
+
+def normalize_amounts(values, dr_negative=True):
+    """Convert a whole column of raw amount cells to int64 paise in one pass.
+
+    Handles Indian digit grouping (``1,00,102.03``), currency prefixes
+    (``INR34,279.01``) and Dr/Cr suffixes on balances. Blank cells and
+    ``-`` become 0. With ``dr_negative`` a ``Dr`` suffix makes the value
+    negative, as banks print overdrawn balances that way.
+
+    The digits are split at the decimal point and combined as integers, so
+    no value ever passes through a float. Returns ``(paise, errors)``: an
+    int64 array and a boolean array flagging non-blank cells that could not
+    be read as a number.
+    """
+    text = _as_text(values)
+    side = text.str.extract(_SIDE_SUFFIX, expand=False)
+    cleaned = text.str.replace(_SIDE_SUFFIX, '', regex=True).str.replace(_NOISE, '', regex=True)
+    blank = cleaned.isin(_BLANKS)
+
+    parts = cleaned.mask(blank, '0').str.extract(_NUMBER)
+    whole = parts[1].fillna('')
+    fraction = parts[2].fillna('')
+    errors = parts[1].isna() | ((whole == '') & (fraction == ''))
+    # Beyond 16 significant rupee digits the paise no longer fit in int64;
+    # such a cell is flagged like any other unreadable amount.
+    errors |= whole.str.lstrip('0').str.len() > MAX_RUPEE_DIGITS
+
+    rupees = pd.to_numeric(whole.mask(whole == '', '0').mask(errors, '0')).astype(np.int64)
+    digits = fraction.mask(errors, '').str.ljust(3, '0')
+    paise = pd.to_numeric(digits.str[:2]).astype(np.int64)
+    round_up = (pd.to_numeric(digits.str[2]) >= 5).astype(np.int64)
+    values = rupees * 100 + paise + round_up
+    values = values.mask(parts[0].eq('-'), -values)
+    if dr_negative:
+        values = values.mask(side.eq('DR'), -values.abs())
+    return values.to_numpy(dtype=np.int64), errors.to_numpy(dtype=bool)
+
+
+def split_debit_credit(amounts, indicators):
+    """Split a single Amount column by its ``Dr / Cr`` column (Bandhan, Axis).
+
+    Returns ``(debit, credit, errors)`` with amounts in int64 paise; rows
+    with an amount but an indicator that is neither Dr nor Cr are flagged.
+    """
+    values, errors = normalize_amounts(amounts, dr_negative=False)
+    side = _as_text(indicators).str.replace(r'[^A-Z]', '', regex=True).str[:1]
+    is_debit = side.eq('D').to_numpy(dtype=bool)
+    is_credit = side.eq('C').to_numpy(dtype=bool)
+    values = np.abs(values)
+    debit = np.where(is_debit, values, 0)
+    credit = np.where(is_credit, values, 0)
+    errors = errors | ((values != 0) & ~is_debit & ~is_credit)
+    return debit, credit, errors
+
+
+def normalize_columns(debit=None, credit=None, balance=None, amount=None, dr_cr=None):
+    """Normalize a page's (or document's) amount columns together.
+
+    Pass either separate ``debit``/``credit`` columns or an ``amount`` column
+    with its ``dr_cr`` indicator column, plus ``balance``. Returns a dict of
+    ``debit``, ``credit`` and ``balance`` int64 paise arrays and a combined
+    per-row ``errors`` array.
+    """
+    columns = [column for column in (debit, credit, balance, amount, dr_cr) if column is not None]
+    if not columns:
+        raise ValueError("No amount columns given")
+    size = len(columns[0])
+    errors = np.zeros(size, dtype=bool)
+
+    if amount is not None:
+        if dr_cr is None:
+            raise ValueError("An amount column needs its Dr/Cr indicator column")
+        debit_values, credit_values, amount_errors = split_debit_credit(amount, dr_cr)
+        errors |= amount_errors
+    else:
+        debit_values, credit_values = np.zeros(size, dtype=np.int64), np.zeros(size, dtype=np.int64)
+        if debit is not None:
+            debit_values, debit_errors = normalize_amounts(debit, dr_negative=False)
+            debit_values = np.abs(debit_values)
+            errors |= debit_errors
+        if credit is not None:
+            credit_values, credit_errors = normalize_amounts(credit, dr_negative=False)
+            credit_values = np.abs(credit_values)
+            errors |= credit_errors
+
+    balance_values = np.zeros(size, dtype=np.int64)
+    if balance is not None:
+        balance_values, balance_errors = normalize_amounts(balance)
+        errors |= balance_errors
+
+    return {'debit': debit_values, 'credit': credit_values, 'balance': balance_values, 'errors': errors}
+
+
+def _as_text(values):
+    series = pd.Series(list(values), dtype=object)
+    return series.where(series.notna(), '').astype(str).str.strip().str.upper()
@@ -0,0 +1,248 @@
+import re
+
+# Signatures every supported bank prints on the first page of a statement.
+# Keywords and header tokens are matched against lower-cased text with all
+# whitespace removed, because several banks (HDFC, Kotak) lay text out with
+# no spaces between words.
+BANK_SIGNATURES = {
+    'SBI': {
+        'keywords': ['statebankofindia'],
+        'ifsc': ['SBIN'],
+        'headers': [['txnvaluedescriptionrefbranch']],
+    },
+    'AXIS': {
+        'keywords': ['axisbank'],
+        'ifsc': ['UTIB'],
+        'headers': [['s.no', 'debit/credit'], ['s.no.', 'trandate', 'dr/cr']],
+    },
+    'YES': {
+        'keywords': ['yesbank'],
+        'ifsc': ['YESB'],
+        'headers': [['referencenumber', 'withdrawals', 'deposits'],
+                    ['chequeno/referenceno', 'withdrawals', 'deposits']],
+    },
+    'IOB': {
+        'keywords': ['indianoverseasbank'],
+        'ifsc': ['IOBA'],
+        'headers': [['transactiontype', 'debit(rs)', 'credit(rs)']],
+    },
+    'BANDHAN': {
+        'keywords': ['bandhanbank'],
+        'ifsc': ['BDBL'],
+        'headers': [['transactiondate', 'valuedate', 'dr/cr']],
+    },
+    'HSBC': {
+        'keywords': ['hsbc'],
+        'ifsc': ['HSBC'],
+        'headers': [['(dr=debit)']],
+    },
+    'UNION': {
+        'keywords': ['unionbankofindia'],
+        'ifsc': ['UBIN'],
+        'headers': [['transactionid', 'remarks', 'amount(rs.)']],
+    },
+    'INDIAN': {
+        'keywords': ['indianbank'],
+        'ifsc': ['IDIB'],
+        'headers': [['postdatevaluedatedetails']],
+    },
+    'FEDERAL': {
+        'keywords': ['federalbank'],
+        'ifsc': ['FDRL'],
+        'headers': [['tranid', 'withdrawals', 'deposits']],
+    },
+    'JK': {
+        'keywords': ['jammuandkashmirbank', 'jkbank'],
+        'ifsc': ['JAKA'],
+        'headers': [['particularschq.no.withdrawals']],
+    },
+    'IDBI': {
+        'keywords': ['idbibank'],
+        'ifsc': ['IBKL'],
+        'headers': [['s.no', 'txndate', 'valuedate', 'chequeno'],
+                    ['particularschq.nowithdrawalsdepositsbalance']],
+    },
+    'BOB': {
+        'keywords': ['bankofbaroda'],
+        'ifsc': ['BARB'],
+        'headers': [['serialtransactionvalue']],
+    },
+    'HDFC': {
+        'keywords': ['hdfcbank'],
+        'ifsc': ['HDFC'],
+        'headers': [['narration', 'chq./ref.no.', 'closingbalance']],
+    },
+    'PNB': {
+        'keywords': ['punjabnationalbank'],
+        'ifsc': ['PUNB'],
+        'headers': [],
+    },
+    'CBI': {
+        'keywords': ['centralbankofindia'],
+        'ifsc': ['CBIN'],
+        'headers': [['postdatevaluebranch']],
+    },
+    'KARNATAKA': {
+        'keywords': ['karnatakabank', 'ktkbank'],
+        'ifsc': ['KARB'],
+        'headers': [['particularswithdrawalsdepositsbalance']],
+    },
+    'KOTAK': {
+        'keywords': ['kotakmahindrabank', 'kotak'],
+        'ifsc': ['KKBK'],
+        'headers': [['withdrawal(dr)', 'deposit(cr)']],
+    },
+    'CANARA': {
+        'keywords': ['canarabank'],
+        'ifsc': ['CNRB'],
+        'headers': [['particularsdepositswithdrawalsbalance']],
+    },
+    'INDUSIND': {
+        'keywords': ['indusindbank'],
+        'ifsc': ['INDB'],
+        'headers': [['chqno/refno', 'withdrawal', 'deposit']],
+    },
+}
+
+UNKNOWN_BANK = 'UNKNOWN'
+
+IFSC_WEIGHT = 5
+HEADER_WEIGHT = 3
+KEYWORD_WEIGHT = 2
+
+# Score at which a bank is considered fully identified (an account IFSC).
+FULL_SCORE = IFSC_WEIGHT
+
+DEFAULT_MIN_CONFIDENCE = 0.5
+
+# Only an IFSC printed next to an "IFSC"/"IFS Code" label identifies the
+# account's own bank; narrations are full of other banks' IFSCs. Matched on
+# the compacted text, like every other signature.
+_LABELLED_IFSC = r'ifsc?(?:code)?[:\-.]?(?P<ifsc>[a-z]{4})0[a-z0-9]{6}'
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _build_matcher(signatures):
+    """One regex for every keyword, header token and the IFSC label.
+
+    The tokens are folded into a trie-shaped pattern, so at each position
+    of the text the engine follows a single branch per character instead
+    of retrying every token; the cost of a scan grows with the text, not
+    with the number of banks. Each alternative sits in a lookahead, so
+    every position is tried and the longest token starting there is
+    reported; tokens that are prefixes of a longer one found at the same
+    spot (``s.no`` in ``s.no.``) are added back from ``prefixes``.
+    """
+    tokens = set()
+    for signature in signatures.values():
+        tokens.update(signature['keywords'])
+        for header in signature['headers']:
+            tokens.update(header)
+    pattern = re.compile(f'(?=(?:{_LABELLED_IFSC}|(?P<token>{_trie_pattern(tokens)})))')
+    prefixes = {token: [other for other in tokens if token.startswith(other)] for token in tokens}
+    return pattern, prefixes
+
+
+def _trie_pattern(tokens):
+    trie = {}
+    for token in tokens:
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+_MATCHER, _PREFIXES = _build_matcher(BANK_SIGNATURES)
+
+
+def scan_signatures(text):
+    """Every signature token and labelled IFSC prefix in ``text``, in one pass."""
+    compact = _WHITESPACE.sub('', text).lower()
+    tokens, ifsc_prefixes = set(), set()
+    for match in _MATCHER.finditer(compact):
+        if match.group('ifsc'):
+            ifsc_prefixes.add(match.group('ifsc').upper())
+        elif match.group('token'):
+            tokens.update(_PREFIXES[match.group('token')])
+    return tokens, ifsc_prefixes
+
+
+def rank_banks(text):
+    """Every bank with any signature in ``text``, best first, with evidence.
+
+    Returns a list of ``{'bank', 'score', 'evidence'}`` dicts; evidence
+    names the IFSC prefix, keyword and header that matched. Ties are
+    broken by bank id so the ranking never depends on signature order.
+    """
+    tokens, ifsc_prefixes = scan_signatures(text)
+    ranked = []
+    for bank, signature in BANK_SIGNATURES.items():
+        score, evidence = 0, []
+        ifsc = sorted(ifsc_prefixes.intersection(signature['ifsc']))
+        if ifsc:
+            score += IFSC_WEIGHT
+            evidence.append(f'ifsc:{ifsc[0]}')
+        keyword = next((keyword for keyword in signature['keywords'] if keyword in tokens), None)
+        if keyword:
+            score += KEYWORD_WEIGHT
+            evidence.append(f'keyword:{keyword}')
+        header = next((header for header in signature['headers'] if tokens.issuperset(header)), None)
+        if header:
+            score += HEADER_WEIGHT
+            evidence.append('header:' + '+'.join(header))
+        if score:
+            ranked.append({'bank': bank, 'score': score, 'evidence': evidence})
+    ranked.sort(key=lambda item: (-item['score'], item['bank']))
+    return ranked
+
+
+def score_banks(text):
+    """Score every known bank against ``text``; returns ``{bank: score}``."""
+    return {item['bank']: item['score'] for item in rank_banks(text)}
+
+
+def identify_bank_with_confidence(text):
+    """Return ``(bank_name, confidence)`` for ``text``.
+
+    Confidence combines how strong the best match is with how far it is
+    ahead of the runner-up, so a page mentioning two banks equally scores 0.
+    """
+    ranked = rank_banks(text)
+    if not ranked:
+        return UNKNOWN_BANK, 0.0
+
+    bank, top = ranked[0]['bank'], ranked[0]['score']
+    runner_up = ranked[1]['score'] if len(ranked) > 1 else 0
+    strength = min(top, FULL_SCORE) / FULL_SCORE
+    margin = (top - runner_up) / top
+    return bank, round(strength * margin, 3)
+
+
+def identify_statement(session, min_confidence=DEFAULT_MIN_CONFIDENCE):
+    """Identify the bank of a ``PdfSession`` from its first page.
+
+    Every signature appears on page 1 (IFSC, bank name and the transaction
+    table header), so further pages are only extracted when the first page
+    scores below ``min_confidence``. Returns
+    ``(bank_name, confidence, pages_scanned)``.
+    """
+    page_count = session.page_count
+    pages_scanned = min(1, page_count)
+    bank, confidence = identify_bank_with_confidence(session.page_text(0)) if page_count else (UNKNOWN_BANK, 0.0)
+
+    for limit in (3, page_count):
+        if confidence >= min_confidence or limit <= pages_scanned:
+            continue
+        pages_scanned = min(limit, page_count)
+        bank, confidence = identify_bank_with_confidence(session.extract_text(max_pages=pages_scanned))
+
+    return bank, confidence, pages_scanned
@@ -0,0 +1,123 @@
+from table_extract import extract_table, extract_tables
+
+HEADER_KEYWORDS = (
+    'date', 'particulars', 'description', 'narration', 'details', 'remarks',
+    'debit', 'credit', 'withdrawal', 'deposit', 'balance', 'amount',
+    'cheque', 'chq', 'ref', 'type',
+)
+
+MIN_HEADER_SCORE = 3
+EDGE_MARGIN = 1
+
+
+def header_score(row):
+    """Number of cells in ``row`` that look like transaction-table column labels."""
+    score = 0
+    for cell in row:
+        text = (cell or '').lower()
+        if any(keyword in text for keyword in HEADER_KEYWORDS):
+            score += 1
+    return score
+
+
+class ColumnTemplate:
+    """Column x-boundaries learned from a statement's transaction-table header.
+
+    Learned once from page 1, the template is applied to every continuation
+    page as ``explicit`` vertical lines on a crop of the table region, which
+    replaces re-running full line and text detection per page and keeps
+    multi-line cells in their columns.
+    """
+
+    def __init__(self, labels, boundaries, horizontal_strategy='lines'):
+        self.labels = list(labels)
+        self.boundaries = list(boundaries)
+        self.horizontal_strategy = horizontal_strategy
+
+    @property
+    def table_settings(self):
+        return self._settings(self.boundaries)
+
+    def _settings(self, boundaries):
+        return {
+            'vertical_strategy': 'explicit',
+            'explicit_vertical_lines': boundaries,
+            'horizontal_strategy': self.horizontal_strategy,
+        }
+
+    @property
+    def date_column(self):
+        for i, label in enumerate(self.labels):
+            if 'date' in (label or '').lower():
+                return i
+        return 0
+
+    def extract(self, page):
+        """Rows of the transaction table on ``page``, or None if it does not fit.
+
+        The page is cropped to the template's column span. When the page
+        repeats the column header, anything above it (letterheads, account
+        blocks) is dropped. A page whose date column holds no digits at all
+        is not laid out like the template, and the caller should fall back.
+        """
+        x0, top, x1, bottom = page.bbox
+        bbox = (
+            max(x0, self.boundaries[0] - EDGE_MARGIN),
+            top,
+            min(x1, self.boundaries[-1] + EDGE_MARGIN),
+            bottom,
+        )
+        # A table ruled to the very page edge must keep its outer lines.
+        boundaries = [min(max(x, bbox[0]), bbox[2]) for x in self.boundaries]
+        tables = extract_tables(page.crop(bbox), self._settings(boundaries))
+        rows = [row for table in tables for row in table if row]
+        for i, row in enumerate(rows):
+            if header_score(row) >= MIN_HEADER_SCORE:
+                rows = rows[i:]
+                break
+        return rows if self.matches(rows) else None
+
+    def matches(self, rows):
+        column = self.date_column
+        for row in rows:
+            if len(row) != len(self.labels):
+                return False
+        return any(column < len(row) and any(ch.isdigit() for ch in (row[column] or '')) for row in rows)
+
+    def to_dict(self):
+        return {
+            'labels': self.labels,
+            'boundaries': self.boundaries,
+            'horizontal_strategy': self.horizontal_strategy,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['labels'], data['boundaries'], data.get('horizontal_strategy', 'lines'))
+
+
+def template_from_tables(tables):
+    """Learn a template from ``page.find_tables()`` results of a header page.
+
+    The table whose first row scores best as a header wins; its cell edges
+    become the column boundaries. Tables without ruled rows (only the header
+    is boxed, as on Canara) get a ``text`` horizontal strategy.
+    """
+    best = None
+    for table in tables:
+        rows = extract_table(table, table.page.chars)
+        if not rows or len(rows[0]) < MIN_HEADER_SCORE:
+            continue
+        score = header_score(rows[0])
+        if score >= MIN_HEADER_SCORE and (best is None or score > best[0]):
+            best = (score, table, rows)
+    if best is None:
+        return None
+
+    _, table, rows = best
+    cells = table.rows[0].cells
+    labels = [label for label, cell in zip(rows[0], cells) if cell is not None]
+    boundaries = [cell[0] for cell in cells if cell is not None] + [table.bbox[2]]
+    horizontal_strategy = 'lines' if len(rows) > 2 else 'text'
+    return ColumnTemplate(labels, boundaries, horizontal_strategy)
+
@@ -0,0 +1,138 @@
+import re
+from datetime import date
+from functools import lru_cache
+
+# strptime-style formats each bank prints its transaction dates in, most
+# common first.
+BANK_DATE_FORMATS = {
+    'SBI': ['%d %b %Y'],
+    'AXIS': ['%d/%m/%Y', '%d-%m-%Y'],
+    'YES': ['%Y-%m-%d', '%d-%b-%Y'],
+    'IOB': ['%d-%b-%y'],
+    'BANDHAN': ['%B%d, %Y', '%B %d, %Y'],
+    'HSBC': ['%d%b%Y'],
+    'UNION': ['%d/%m/%Y'],
+    'INDIAN': ['%d/%m/%y'],
+    'FEDERAL': ['%d-%b-%Y'],
+    'JK': ['%d-%m-%Y'],
+    'IDBI': ['%d-%m-%Y', '%d/%m/%Y'],
+    'BOB': ['%d-%m-%Y'],
+    'HDFC': ['%d/%m/%y'],
+    'PNB': ['%d/%m/%Y', '%d-%m-%Y'],
+    'CBI': ['%d/%m/%Y'],
+    'KARNATAKA': ['%d-%m-%Y'],
+    'KOTAK': ['%d-%b-%y'],
+    'CANARA': ['%d-%m-%Y'],
+    'INDUSIND': ['%d %b %Y'],
+}
+
+# Tried for unknown banks, and after a bank's own formats, before dateutil.
+COMMON_FORMATS = ['%d/%m/%Y', '%d-%m-%Y', '%d-%b-%Y', '%d-%b-%y', '%d/%m/%y', '%Y-%m-%d', '%d %b %Y']
+
+DATE_CACHE_SIZE = 4096
+
+_DIRECTIVES = {
+    '%d': r'(?P<day>\d{1,2})',
+    '%m': r'(?P<month>\d{1,2})',
+    '%b': r'(?P<month_name>[A-Za-z]{3,4})',
+    '%B': r'(?P<month_name>[A-Za-z]{3,9})',
+    '%y': r'(?P<year2>\d{2})',
+    '%Y': r'(?P<year>\d{4})',
+}
+_MONTHS = {name: i for i, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1)}
+_TRAILING_TIME = re.compile(r'\s+\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AP]M)?$', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+_PARENTHESISED = re.compile(r'\([^)]*\)')
+# dateutil will happily read "5", "100" or "1 Sep" as a date in the current
+# year, so it only sees text that already carries a year.
+_HAS_YEAR = re.compile(r'(?<!\d)(?:19|20)\d{2}(?!\d)|\d{1,2}[/.\-]\d{1,2}[/.\-]\d{2}(?!\d)')
+
+
+def _compile(fmt):
+    pattern = re.escape(fmt)
+    for directive, group in _DIRECTIVES.items():
+        pattern = pattern.replace(re.escape(directive), group)
+    pattern = pattern.replace(r'\ ', r'\s*')
+    return re.compile(f'^{pattern}$')
+
+
+_COMPILED = {fmt: _compile(fmt) for formats in BANK_DATE_FORMATS.values() for fmt in formats}
+_COMPILED.update({fmt: _compile(fmt) for fmt in COMMON_FORMATS})
+
+
+def _candidates(raw):
+    """The cell's first line, then the whole cell on one line.
+
+    Most cells carry the date on the first line (IOB adds the value date
+    below it in parentheses), but SBI wraps "1 Sep" and "2025" onto two.
+    """
+    lines = [line.strip() for line in str(raw).strip().split('\n')]
+    first = _WHITESPACE.sub(' ', _TRAILING_TIME.sub('', lines[0]))
+    joined = _WHITESPACE.sub(' ', _PARENTHESISED.sub(' ', ' '.join(lines))).strip()
+    joined = _TRAILING_TIME.sub('', joined)
+    return [first] if joined == first else [first, joined]
+
+
+def _match(text, fmt):
+    match = _COMPILED[fmt].match(text)
+    if not match:
+        return None
+    parts = match.groupdict()
+    if parts.get('month_name'):
+        month = _MONTHS.get(parts['month_name'][:3].lower())
+    else:
+        month = int(parts['month'])
+    year = int(parts['year']) if parts.get('year') else 2000 + int(parts['year2'])
+    try:
+        return date(year, month, int(parts['day'])).isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse(raw, bank):
+    candidates = [text for text in _candidates(raw) if text]
+    formats = BANK_DATE_FORMATS.get(bank, []) + COMMON_FORMATS
+    for text in candidates:
+        for fmt in formats:
+            parsed = _match(text, fmt)
+            if parsed:
+                return parsed
+    for text in candidates:
+        if not _HAS_YEAR.search(text):
+            continue
+        try:
+            from dateutil import parser as date_util
+            return date_util.parse(text, dayfirst=True).date().isoformat()
+        except (ValueError, OverflowError):
+            continue
+    return None
+
+
+def parse_date(raw, bank=None):
+    """ISO ``YYYY-MM-DD`` for a raw date cell, or None if it is not a date.
+
+    The bank's known formats are tried first through precompiled patterns,
+    then the common Indian formats, then ``dateutil`` as a last resort.
+    Results are memoized per (raw string, bank): a statement has at most a
+    few hundred distinct dates across thousands of rows.
+    """
+    if raw is None:
+        return None
+    return _parse(str(raw), bank)
+
+
+def parse_dates(column, bank=None):
+    """Parse a whole column of raw date cells, each distinct value once."""
+    seen = {}
+    result = []
+    for raw in column:
+        if raw not in seen:
+            seen[raw] = parse_date(raw, bank)
+        result.append(seen[raw])
+    return result
+
+
+def clear_date_cache():
+    _parse.cache_clear()
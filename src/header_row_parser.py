@@ -0,0 +1,117 @@
+import re
+
+import numpy as np
+
+from amount_normalizer import normalize_amounts, normalize_columns
+from column_template import MIN_HEADER_SCORE, header_score
+from date_parser import parse_date
+from money import paise_to_rupees
+
+_LETTERS = re.compile(r'[^a-z]')
+
+
+def column_role(label):
+    """What a transaction-table column holds, from its header label, or None."""
+    text = (label or '').lower()
+    letters = _LETTERS.sub('', text)
+    if letters in ('drcr', 'crdr', 'debitcredit', 'creditdebit', 'type'):
+        return 'dr_cr'
+    if 'balance' in text:
+        return 'balance'
+    if 'date' in text:
+        return 'value_date' if 'value' in text else 'date'
+    if 'debit' in text or 'withdrawal' in text or letters == 'dr':
+        return 'debit'
+    if 'credit' in text or 'deposit' in text or letters == 'cr':
+        return 'credit'
+    if 'amount' in text:
+        return 'amount'
+    if any(word in text for word in ('particulars', 'description', 'narration', 'details', 'remarks')):
+        return 'description'
+    return None
+
+
+class HeaderRowParser:
+    """Row parser for ``StatementStream`` driven by the table's own header row.
+
+    Columns are located from the labels of the last header row seen (banks
+    repeat it on every page, and a word layout leads its rows with its
+    column labels), so one instance works for any bank whose table names
+    its date, description and amount columns. Rows whose date cell does not
+    parse are skipped. Amounts are normalized a page at a time and returned
+    as float rupees, with ISO dates, in the usual transaction dict.
+    """
+
+    def __init__(self, bank_name=None):
+        self.bank_name = bank_name
+        self.columns = None
+
+    def set_header(self, labels):
+        """Locate the columns from a header row; a row naming no date column is ignored."""
+        columns = {}
+        for i, label in enumerate(labels):
+            role = column_role(label)
+            if role is not None and role not in columns:
+                columns[role] = i
+        if 'date' not in columns and 'value_date' in columns:
+            columns['date'] = columns['value_date']
+        if 'date' in columns:
+            self.columns = columns
+
+    def __call__(self, rows):
+        transactions, entries = [], []
+        for row in rows:
+            if header_score(row) >= MIN_HEADER_SCORE:
+                transactions.extend(self._transactions(entries))
+                entries = []
+                self.set_header(row)
+                continue
+            if self.columns is None:
+                continue
+            date = parse_date(_cell(row, self.columns, 'date'), self.bank_name)
+            if date is not None:
+                entries.append((date, row))
+        transactions.extend(self._transactions(entries))
+        return transactions
+
+    def _transactions(self, entries):
+        if not entries:
+            return []
+        columns = self.columns
+
+        def column(role):
+            if role not in columns:
+                return None
+            # Text spilling over from the description can wrap into an
+            # amount cell below its figure; the figure is the first line.
+            return [_cell(row, columns, role).strip().split('\n')[0] for _, row in entries]
+
+        if 'amount' in columns and 'dr_cr' in columns:
+            amounts = normalize_columns(amount=column('amount'), dr_cr=column('dr_cr'), balance=column('balance'))
+        elif 'amount' in columns:
+            # One signed column: "2930.00 (Dr)" or "-2930.00" is a debit.
+            amounts = normalize_columns(balance=column('balance') or [''] * len(entries))
+            signed, amount_errors = normalize_amounts(column('amount'))
+            amounts['debit'] = np.where(signed < 0, -signed, 0)
+            amounts['credit'] = np.where(signed > 0, signed, 0)
+            amounts['errors'] |= amount_errors
+        else:
+            amounts = normalize_columns(debit=column('debit') or [''] * len(entries), credit=column('credit'),
+                                        balance=column('balance'))
+        return [
+            {
+                'date': date,
+                'description': ' '.join(_cell(row, columns, 'description').split()),
+                'debit': paise_to_rupees(int(amounts['debit'][i])),
+                'credit': paise_to_rupees(int(amounts['credit'][i])),
+                'balance': paise_to_rupees(int(amounts['balance'][i])),
+            }
+            for i, (date, row) in enumerate(entries)
+        ]
+
+
+def _cell(row, columns, role):
+    index = columns.get(role)
+    if index is None or index >= len(row):
+        return ''
+    return row[index] or ''
@@ -0,0 +1,133 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_PENDING = 8
+DEFAULT_MAX_FINISHED = 64
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class QueueFull(Exception):
+    """Raised by ``JobQueue.submit`` when too many jobs are already waiting."""
+
+
+class Job:
+    """One submitted parse: its status, page progress and, once done, result."""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = QUEUED
+        self.pages_done = 0
+        self.pages_total = None
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def set_progress(self, pages_done, pages_total=None):
+        self.pages_done = pages_done
+        if pages_total is not None:
+            self.pages_total = pages_total
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+    def to_dict(self):
+        data = {
+            'id': self.id,
+            'status': self.status,
+            'progress': {'pages_done': self.pages_done, 'pages_total': self.pages_total},
+        }
+        if self.status == DONE:
+            data['result'] = self.result
+        elif self.status == FAILED:
+            data['error'] = self.error
+        if self.finished_at is not None:
+            data['seconds'] = round(self.finished_at - (self.started_at or self.submitted_at), 3)
+        return data
+
+
+class JobQueue:
+    """Runs parse jobs on a bounded pool of local worker threads.
+
+    ``submit`` returns at once with a ``Job`` the caller can poll by id.
+    At most ``max_pending`` jobs may be queued or running; beyond that
+    ``submit`` raises ``QueueFull`` instead of letting the backlog (and the
+    uploads it holds in memory) grow without bound. The last
+    ``max_finished`` finished jobs are kept for polling.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, max_pending=DEFAULT_MAX_PENDING,
+                 max_finished=DEFAULT_MAX_FINISHED):
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='parse-job')
+        self._jobs = OrderedDict()
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def submit(self, work):
+        """Queue ``work(job)``; its return value becomes the job's result.
+
+        ``work`` may call ``job.set_progress(pages_done, pages_total)`` as
+        it goes.
+        """
+        job = Job()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise QueueFull(f"{self._pending} jobs already pending")
+            self._pending += 1
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, work)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    @property
+    def pending(self):
+        with self._lock:
+            return self._pending
+
+    def wait(self, job_id, timeout=None):
+        """Block until a job finishes; for tests and synchronous callers."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        job = self.get(job_id)
+        while job is not None and not job.finished:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+        return job
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job, work):
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = work(job)
+            job.status = DONE
+        except Exception as e:
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._pending -= 1
+                self._forget_finished()
+
+    def _forget_finished(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
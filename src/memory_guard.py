@@ -0,0 +1,89 @@
+import gc
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class MemoryLimitExceeded(MemoryError):
+    pass
+
+
+def current_rss_bytes():
+    """Resident set size of this process now, the peak where that is unknown, or None."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    return peak_rss_bytes()
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process, or None where it cannot be read."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes.
+        return peak if sys.platform == 'darwin' else peak * 1024
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss)
+    return None
+
+
+class MemoryGuard:
+    """Samples RSS between pages and enforces an optional ceiling.
+
+    ``check`` records the peak seen so far. Over ``max_rss_mb`` it calls
+    ``reclaim`` and runs the garbage collector once; if the process is
+    still over the ceiling it raises ``MemoryLimitExceeded`` rather than
+    letting one statement take the host down.
+
+    RSS is a property of the whole process: concurrent requests, job queue
+    threads and anything else the server holds all count against one
+    statement's ``max_rss_mb``, so set it for the process, not per parse.
+    Where RSS cannot be read (Windows without ``psutil``) nothing is
+    enforced and the peak is reported as None.
+    """
+
+    def __init__(self, max_rss_mb=None):
+        self.max_rss_mb = max_rss_mb
+        self.peak_bytes = 0
+        self.measured = True
+
+    def check(self, reclaim=None):
+        rss = self._sample()
+        if rss is None or self.max_rss_mb is None or rss <= self.max_rss_mb * 1024 * 1024:
+            return
+        if reclaim is not None:
+            reclaim()
+        gc.collect()
+        rss = self._sample()
+        if rss > self.max_rss_mb * 1024 * 1024:
+            raise MemoryLimitExceeded(
+                f"RSS {rss / 1024 / 1024:.0f} MB is over the {self.max_rss_mb} MB ceiling"
+            )
+
+    @property
+    def peak_mb(self):
+        if not self.measured:
+            return None
+        return round(self.peak_bytes / 1024 / 1024, 1)
+
+    def _sample(self):
+        rss = current_rss_bytes()
+        if rss is None:
+            self.measured = False
+            return None
+        self.peak_bytes = max(self.peak_bytes, rss)
+        return rss
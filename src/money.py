@@ -0,0 +1,25 @@
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+PAISE_PER_RUPEE = 100
+
+
+def rupees_to_paise(value):
+    """Exact integer paise for a rupee amount given as a float, str or Decimal.
+
+    Floats are converted through their shortest repr, so ``34279.01``
+    becomes ``3427901`` rather than the binary approximation's neighbour.
+    """
+    if value is None or value == '':
+        return 0
+    if isinstance(value, int):
+        return value * PAISE_PER_RUPEE
+    try:
+        amount = Decimal(str(value).replace(',', ''))
+    except InvalidOperation:
+        raise ValueError(f"Not an amount: {value!r}")
+    return int((amount * PAISE_PER_RUPEE).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+
+def paise_to_rupees(paise):
+    """Float rupees for the JSON boundary; everything else stays in paise."""
+    return int(paise) / PAISE_PER_RUPEE
@@ -0,0 +1,83 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from pdfminer.pdftypes import PDFStream, resolve1
+
+DEFAULT_MAX_PAGES = 2048
+
+
+def page_fingerprint(page, extra=''):
+    """Hash of what a page draws: its content streams, form XObjects and fonts.
+
+    Re-issued statements with an extended date range repeat the earlier
+    pages byte for byte in content even though the file as a whole differs,
+    so this matches those pages. Decoded (and decrypted) stream data is
+    hashed, which makes the fingerprint independent of object numbering and
+    of the document's encryption key. ``extra`` lets callers fold in
+    anything else the cached rows depend on, such as table settings.
+    """
+    page_obj = page.page_obj
+    digest = hashlib.sha256()
+    digest.update(repr(tuple(page.mediabox)).encode('utf-8'))
+    digest.update(extra.encode('utf-8'))
+    for stream in page_obj.contents or []:
+        stream = resolve1(stream)
+        if isinstance(stream, PDFStream):
+            digest.update(stream.get_data())
+    _hash_resources(digest, page_obj.resources, set())
+    return digest.hexdigest()
+
+
+def _hash_resources(digest, resources, seen):
+    resources = resolve1(resources) or {}
+    fonts = resolve1(resources.get('Font')) or {}
+    for name in sorted(fonts):
+        font = resolve1(fonts[name]) or {}
+        digest.update(f"{name}:{resolve1(font.get('BaseFont'))}".encode('utf-8'))
+
+    xobjects = resolve1(resources.get('XObject')) or {}
+    for name in sorted(xobjects):
+        ref = xobjects[name]
+        objid = getattr(ref, 'objid', None)
+        xobject = resolve1(ref)
+        if not isinstance(xobject, PDFStream) or objid in seen:
+            continue
+        if objid is not None:
+            seen.add(objid)
+        digest.update(name.encode('utf-8'))
+        if getattr(resolve1(xobject.get('Subtype')), 'name', None) == 'Form':
+            digest.update(xobject.get_data())
+            _hash_resources(digest, xobject.get('Resources'), seen)
+
+
+class PageRowCache:
+    """Bounded LRU of raw table rows per page fingerprint.
+
+    Rows are cached before stitching, so rows that carry over a page
+    boundary are still joined correctly when a statement mixes cached and
+    freshly extracted pages.
+    """
+
+    def __init__(self, max_pages=DEFAULT_MAX_PAGES):
+        self.max_pages = max_pages
+        self._rows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fingerprint):
+        with self._lock:
+            rows = self._rows.get(fingerprint)
+            if rows is None:
+                return None
+            self._rows.move_to_end(fingerprint)
+        return [list(row) for row in rows]
+
+    def put(self, fingerprint, rows):
+        with self._lock:
+            self._rows[fingerprint] = tuple(tuple(row) for row in rows)
+            self._rows.move_to_end(fingerprint)
+            while len(self._rows) > self.max_pages:
+                self._rows.popitem(last=False)
+
+    def __len__(self):
+        return len(self._rows)
@@ -0,0 +1,33 @@
+import re
+
+# Any date form a statement prints a transaction with: 01/04/2025, 1-4-25,
+# 22-Dec-2024, 1 Sep 2025, 2025-07-30, September 1, 2025.
+_DATE = re.compile(
+    r'\d{1,2}\s*[/\-.]\s*\d{1,2}\s*[/\-.]\s*\d{2,4}'
+    r'|\d{1,2}\s*[\-\s]?\s*[A-Za-z]{3}\s*[\-\s,]?\s*\d{2,4}'
+    r'|\d{4}-\d{2}-\d{2}'
+    r'|[A-Za-z]{3,9}\s*\d{1,2},\s*\d{4}'
+)
+_AMOUNT = re.compile(r'\d\.\d{2}(?!\d)')
+
+MIN_DATES = 1
+MIN_AMOUNTS = 1
+
+
+def page_char_text(page):
+    return ''.join(char['text'] for char in page.chars)
+
+
+def may_hold_transactions(page):
+    """Cheap check whether ``page`` can carry transaction rows at all.
+
+    Cover letters, code legends, interest certificates and disclaimer
+    pages either print no date or no amount with paise. Only the page's
+    characters are read, which pdfplumber parses once and shares with the
+    table pass, so a page that passes costs a couple of regex scans, and a
+    page that fails skips line detection and table building entirely.
+    """
+    text = page_char_text(page)
+    if len(_AMOUNT.findall(text)) < MIN_AMOUNTS:
+        return False
+    return len(_DATE.findall(text)) >= MIN_DATES
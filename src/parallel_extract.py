@@ -0,0 +1,136 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from pdf_session import PdfSession
+
+# Below this many pages per worker, process start-up costs more than it saves.
+MIN_PAGES_PER_WORKER = 4
+CHUNKS_PER_WORKER = 2
+
+
+def default_workers():
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def split_page_ranges(page_count, workers, chunks_per_worker=CHUNKS_PER_WORKER):
+    """Split ``range(page_count)`` into contiguous ``(start, stop)`` chunks.
+
+    A few more chunks than workers keeps the pool busy when some pages are
+    much denser than others.
+    """
+    if page_count <= 0:
+        return []
+    chunk_count = max(1, min(page_count, workers * chunks_per_worker))
+    size = math.ceil(page_count / chunk_count)
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def _extract_range(pdf_path, password, start, stop, table_settings, probe=None):
+    pages = []
+    with PdfSession(pdf_path, password) as session:
+        for index in range(start, stop):
+            pages.append((index, _page_tables(session, index, table_settings, probe)))
+            session.release_page(index)
+    return pages
+
+
+def _page_tables(session, index, table_settings, probe):
+    if probe is not None and not probe(session.page(index)):
+        return None
+    return session.page_tables(index, table_settings)
+
+
+def extract_page_tables(pdf_path, password=None, workers=1, table_settings=None, probe=None):
+    """Extract the tables of every page, returned as a page-ordered list.
+
+    With ``workers > 1`` contiguous page ranges are spread across a process
+    pool; ``extract_tables`` is CPU-bound pdfminer work, so this scales with
+    cores on large statements. Each element of the result is the list of
+    tables of one page, exactly as ``page.extract_tables()`` returns it.
+    ``pdf_path`` may be the statement's bytes; each worker then opens its
+    own in-memory copy. With a ``probe`` (a module-level function taking a
+    page, such as ``may_hold_transactions``) pages it rejects are not
+    extracted and come back as None.
+    """
+    password = password or None
+    with PdfSession(pdf_path, password) as session:
+        page_count = session.page_count
+        workers = min(workers or 1, page_count // MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            return [_page_tables(session, i, table_settings, probe) for i in range(page_count)]
+
+    results = [None] * page_count
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_extract_range, pdf_path, password, start, stop, table_settings, probe)
+            for start, stop in split_page_ranges(page_count, workers)
+        ]
+        for future in futures:
+            for index, tables in future.result():
+                results[index] = tables
+    return results
+
+
+def is_continuation_row(row):
+    """A row whose first cell is empty continues the previous transaction."""
+    return bool(row) and not (row[0] or '').strip() and any((cell or '').strip() for cell in row)
+
+
+def merge_rows(previous, row):
+    """Append each non-empty cell of ``row`` to the matching cell of ``previous``."""
+    merged = list(previous)
+    for i, cell in enumerate(row):
+        cell = (cell or '').strip()
+        if not cell:
+            continue
+        if i >= len(merged):
+            merged.append(cell)
+        else:
+            merged[i] = f"{merged[i]}\n{cell}" if merged[i] else cell
+    return merged
+
+
+def is_header_row(row):
+    """Column header rows carry labels only, never dates or amounts."""
+    cells = [(cell or '').strip() for cell in row]
+    return sum(1 for cell in cells if cell) >= 2 and not any(ch.isdigit() for cell in cells for ch in cell)
+
+
+def carry_over(previous, page, is_continuation=is_continuation_row, merge=merge_rows):
+    """Merge a page's leading continuation rows into ``previous``.
+
+    Continuation pages usually repeat the column header first, so the
+    continuation rows are looked for after any leading header rows. Returns
+    the merged row and the page's remaining rows.
+    """
+    start = 0
+    while start < len(page) and is_header_row(page[start]):
+        start += 1
+    end = start
+    while end < len(page) and is_continuation(page[end]):
+        previous = merge(previous, page[end])
+        end += 1
+    return previous, page[:start] + page[end:]
+
+
+def stitch_pages(page_rows, is_continuation=is_continuation_row, merge=merge_rows):
+    """Flatten per-page rows, joining rows that carry over a page boundary.
+
+    Leading continuation rows of a page are merged into the last row of the
+    previous page, so the result is the same whether the pages were
+    extracted in one pass or in parallel chunks. Continuations within a page
+    are left to the bank parsers, as before.
+    """
+    rows = []
+    for page in page_rows:
+        page = list(page)
+        if rows:
+            rows[-1], page = carry_over(rows[-1], page, is_continuation, merge)
+        rows.extend(page)
+    return rows
+
+
+def table_rows(tables, min_columns=1):
+    """All rows of a page's tables that have at least ``min_columns`` cells."""
+    return [row for table in tables for row in table if row and len(row) >= min_columns]
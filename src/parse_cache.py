@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+# Bump whenever parser output changes so stale cached results are not served.
+PARSER_VERSION = '1.1.0'
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+def make_cache_key(pdf_bytes, parser_id='auto', password=None):
+    """Content address for a parse: PDF bytes + parser version + parser id.
+
+    ``pdf_bytes`` may also be a binary file object (an upload's stream);
+    it is hashed in chunks and left at the position it was found at.
+
+    The password is folded in as a hash salted with the document digest, so
+    a locked statement is never served to a request without its password
+    and the password itself is never stored.
+    """
+    digest = _digest(pdf_bytes)
+    parts = [digest, PARSER_VERSION, parser_id or 'auto']
+    if password:
+        parts.append(hashlib.sha256(f"{digest}:{password}".encode('utf-8')).hexdigest())
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _digest(source, chunk_size=1024 * 1024):
+    if not hasattr(source, 'read'):
+        return hashlib.sha256(source).hexdigest()
+    sha = hashlib.sha256()
+    position = source.tell()
+    try:
+        source.seek(0)
+        for chunk in iter(lambda: source.read(chunk_size), b''):
+            sha.update(chunk)
+    finally:
+        source.seek(position)
+    return sha.hexdigest()
+
+
+class ParseCache:
+    """Parse results keyed by content, in a bounded LRU plus an optional disk tier.
+
+    The memory tier holds at most ``max_entries`` results. When
+    ``cache_dir`` is set, results are also written there as JSON and the
+    least recently used files are evicted once the directory grows past
+    ``max_disk_bytes``. Values ``derived`` from a result live beside it in
+    the memory tier and are evicted with it.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, cache_dir=None, max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._derived = {}
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        result = self._read_disk(key)
+        if result is not None:
+            self._remember(key, result)
+        return result
+
+    def put(self, key, result):
+        self._remember(key, result)
+        self._write_disk(key, result)
+
+    def get_or_parse(self, key, parse):
+        """Return the cached result for ``key`` or run ``parse()`` and store it.
+
+        The returned dict is a copy whose ``metadata['cache']`` says whether
+        it was a ``hit`` or a ``miss``.
+        """
+        result = self.get(key)
+        status = 'hit'
+        if result is None:
+            result = parse()
+            self.put(key, result)
+            status = 'miss'
+        return with_cache_status(result, status)
+
+    def derived(self, key, build):
+        """Memoize ``build()``, a value computed from ``key``'s result, beside it.
+
+        The value is kept only while that result is in the memory tier; when
+        it is not (evicted, or ``max_entries`` is 0) ``build()`` is just called.
+        """
+        with self._lock:
+            if key in self._derived:
+                return self._derived[key]
+        value = build()
+        with self._lock:
+            if key in self._memory:
+                self._derived[key] = value
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._derived.clear()
+        for path, _, _ in self._disk_entries():
+            os.remove(path)
+
+    def _remember(self, key, result):
+        with self._lock:
+            if self._memory.get(key) is not result:
+                self._derived.pop(key, None)
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                evicted, _ = self._memory.popitem(last=False)
+                self._derived.pop(evicted, None)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)
+        return result
+
+    def _write_disk(self, key, result):
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        os.replace(temp_path, path)
+        self._evict_disk()
+
+    def _disk_entries(self):
+        if not self.cache_dir:
+            return []
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict_disk(self):
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def with_cache_status(result, status):
+    result = dict(result)
+    result['metadata'] = dict(result.get('metadata') or {}, cache=status)
+    return result
@@ -0,0 +1,75 @@
+import importlib
+import threading
+
+# Bank id -> "module:Class" of the row parser ``StatementStream`` uses for
+# it. Every bank in ``bank_signatures.BANK_SIGNATURES`` has an entry; a
+# module is imported the first time one of its banks is parsed, so a
+# single-bank parse only pays for that one parser's import. Banks with a
+# text layout (``word_layout.WORD_LAYOUTS``) lead their rows with the
+# layout's column labels, so the header-row parser reads them too.
+ROW_PARSERS = {
+    'SBI': 'header_row_parser:HeaderRowParser',
+    'AXIS': 'header_row_parser:HeaderRowParser',
+    'YES': 'header_row_parser:HeaderRowParser',
+    'IOB': 'header_row_parser:HeaderRowParser',
+    'BANDHAN': 'header_row_parser:HeaderRowParser',
+    'HSBC': 'header_row_parser:HeaderRowParser',
+    'UNION': 'header_row_parser:HeaderRowParser',
+    'INDIAN': 'header_row_parser:HeaderRowParser',
+    'FEDERAL': 'header_row_parser:HeaderRowParser',
+    'JK': 'header_row_parser:HeaderRowParser',
+    'IDBI': 'header_row_parser:HeaderRowParser',
+    'BOB': 'header_row_parser:HeaderRowParser',
+    'HDFC': 'header_row_parser:HeaderRowParser',
+    'PNB': 'header_row_parser:HeaderRowParser',
+    'CBI': 'header_row_parser:HeaderRowParser',
+    'KARNATAKA': 'header_row_parser:HeaderRowParser',
+    'KOTAK': 'header_row_parser:HeaderRowParser',
+    'CANARA': 'header_row_parser:HeaderRowParser',
+    'INDUSIND': 'header_row_parser:HeaderRowParser',
+}
+
+# Unidentified statements, and banks without an entry, use the generic one.
+DEFAULT_ROW_PARSER = 'header_row_parser:HeaderRowParser'
+
+_classes = {}
+_lock = threading.Lock()
+
+
+def register_row_parser(bank_name, path):
+    """Point ``bank_name`` at a ``module:Class`` path."""
+    with _lock:
+        ROW_PARSERS[bank_name] = path
+
+
+def row_parser_path(bank_name):
+    return ROW_PARSERS.get(bank_name, DEFAULT_ROW_PARSER)
+
+
+def get_row_parser(bank_name):
+    """A row parser for one statement of ``bank_name``.
+
+    The class is imported once and shared. Each call builds a new
+    instance: a row parser remembers the header row it last saw, which
+    belongs to one statement only. It is given the bank so dates are read
+    with that bank's formats.
+    """
+    path = row_parser_path(bank_name)
+    cls = _classes.get(path)
+    if cls is None:
+        with _lock:
+            cls = _classes.get(path)
+            if cls is None:
+                cls = _classes[path] = _load(path)
+    return cls(bank_name=bank_name)
+
+
+def loaded_row_parsers():
+    """``module:Class`` paths imported so far."""
+    return sorted(_classes)
+
+
+def _load(path):
+    module_name, _, class_name = path.partition(':')
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
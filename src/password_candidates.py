@@ -0,0 +1,248 @@
+import io
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pdfplumber
+from pdfplumber.utils.exceptions import PdfminerException
+from pdfminer.pdfdocument import PDFDocument, PDFEncryptionError, PDFPasswordIncorrect
+from pdfminer.pdfexceptions import PDFException
+from pdfminer.pdfparser import PDFParser
+from pdfminer.psparser import literal_name
+
+# Above this many candidates, AES-256 checks are spread over a process pool.
+PARALLEL_THRESHOLD = 64
+# Revisions 5 and 6 (AES-256) hash the password in dozens of rounds; the
+# older RC4 and AES-128 checks take well under a millisecond each, less
+# than it costs to start a worker.
+PARALLEL_MIN_REVISION = 5
+MAX_CANDIDATES = 512
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+_DIGIT_RUN = re.compile(r'\d{4,}')
+_DATE = re.compile(r'^(\d{1,2})[/\-. ]?(\d{1,2})[/\-. ]?(\d{2}|\d{4})$')
+_LETTERS = re.compile(r'[^A-Za-z]')
+
+
+class _EncryptionProbe(PDFDocument):
+    """Reads the xref and trailer only; the password is never checked."""
+
+    def _initialize_password(self, password=''):
+        pass
+
+
+def encryption_handler(source):
+    """The standard security handler of a PDF, or None if it is not encrypted.
+
+    Only the cross-reference table and the trailer's ``/Encrypt``
+    dictionary are parsed. The returned handler checks a candidate with
+    ``authenticate`` alone, which is a few hashes and RC4 or AES rounds,
+    instead of the full document open ``pdfplumber.open`` would pay per
+    attempt.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return _handler(io.BytesIO(source))
+    if hasattr(source, 'read'):
+        position = source.tell()
+        try:
+            return _handler(source)
+        finally:
+            source.seek(position)
+    with open(source, 'rb') as f:
+        return _handler(f)
+
+
+def _handler(fp):
+    doc = _EncryptionProbe(PDFParser(fp))
+    if doc.encryption is None:
+        return None
+    docid, param = doc.encryption
+    if literal_name(param.get('Filter')) != 'Standard':
+        raise PDFEncryptionError(f"Unknown filter: param={param!r}")
+    factory = PDFDocument.security_handler_registry.get(int(param.get('V', 0)))
+    if factory is None:
+        raise PDFEncryptionError(f"Unknown algorithm: param={param!r}")
+    handler = factory.__new__(factory)
+    handler.docid, handler.param, handler.password = docid, param, ''
+    handler.init_params()
+    if handler.r not in handler.supported_revisions:
+        raise PDFEncryptionError(f"Unsupported revision: param={param!r}")
+    return handler
+
+
+def password_candidates(filename=None, hints=()):
+    """Likely passwords for a statement, most likely first.
+
+    Banks build statement passwords from numbers the customer already
+    has: the account or customer number (IDBI, IOB), the registered
+    mobile (BOB, JK), or a name prefix with the date of birth. Candidates
+    come from digit runs in the file name and from ``hints`` (account
+    numbers, mobiles, customer ids, dates of birth, names) with their
+    usual fragments and combinations.
+    """
+    numbers, dates, names = [], [], []
+    if filename:
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        numbers.extend(_DIGIT_RUN.findall(stem))
+    for hint in hints:
+        hint = str(hint or '').strip()
+        if not hint:
+            continue
+        if not hint.isdigit() and _DATE.match(hint):
+            dates.append(hint)
+        elif re.sub(r'[\s\-+]', '', hint).isdigit():
+            numbers.append(re.sub(r'[\s\-+]', '', hint))
+        else:
+            names.append(hint)
+
+    # A mobile given with its country code.
+    numbers = [number[2:] if len(number) == 12 and number.startswith('91') else number for number in numbers]
+    candidates = ['']
+    for number in numbers:
+        candidates.append(number)
+        if _DATE.match(number):
+            dates.append(number)
+    for number in numbers:
+        candidates.extend(number[-size:] for size in (4, 5, 6, 8) if len(number) > size)
+        if len(number) > 4:
+            candidates.append(number[:4])
+
+    date_forms = [form for value in dates for form in _date_forms(value)]
+    candidates.extend(date_forms)
+    for name in names:
+        prefix = _LETTERS.sub('', name)[:4]
+        if not prefix:
+            continue
+        for form in date_forms:
+            candidates.extend([prefix.upper() + form, prefix.lower() + form, prefix.capitalize() + form])
+    for number in numbers:
+        if len(number) >= 10:
+            candidates.extend(number[-5:] + form for form in date_forms if len(form) == 6)
+
+    unique = list(dict.fromkeys(candidates))
+    return unique[:MAX_CANDIDATES]
+
+
+def _date_forms(value):
+    match = _DATE.match(value)
+    if not match:
+        return []
+    day, month, year = match.groups()
+    day, month = day.zfill(2), month.zfill(2)
+    if int(day) > 31 or int(month) > 12:
+        return []
+    full_year = year if len(year) == 4 else ('19' if int(year) > 30 else '20') + year
+    return [day + month + full_year, day + month + full_year[2:], day + month, full_year + month + day]
+
+
+def _check(handler, candidates):
+    for candidate in candidates:
+        if handler.authenticate(candidate) is not None:
+            return candidate
+    return None
+
+
+def find_password(source, candidates, workers=None):
+    """The first of ``candidates`` that opens ``source``.
+
+    Returns ``''`` when the PDF is not encrypted and None when no
+    candidate fits. With more than ``PARALLEL_THRESHOLD`` candidates on an
+    AES-256 statement they are checked in chunks across a process pool;
+    the earliest matching candidate still wins.
+
+    The fast check leans on pdfminer internals (the password setup hook and
+    the security handler's fields). Should a pdfminer release change them,
+    each candidate is tried with a plain ``pdfplumber.open`` instead.
+    """
+    candidates = list(candidates)
+    try:
+        return _find_with_handler(source, candidates, workers)
+    except (AttributeError, TypeError):
+        return _find_by_opening(source, candidates)
+
+
+def _find_with_handler(source, candidates, workers):
+    handler = encryption_handler(source)
+    if handler is None:
+        return ''
+    workers = workers or os.cpu_count() or 1
+    if len(candidates) <= PARALLEL_THRESHOLD or workers <= 1 or handler.r < PARALLEL_MIN_REVISION:
+        return _check(handler, candidates)
+
+    size = -(-len(candidates) // workers)
+    chunks = [candidates[i:i + size] for i in range(0, len(candidates), size)]
+    pool = _process_pool(workers)
+    futures = [pool.submit(_check, handler, chunk) for chunk in chunks]
+    try:
+        for future in futures:
+            found = future.result()
+            if found is not None:
+                return found
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        return _check(handler, candidates)
+    finally:
+        for future in futures:
+            future.cancel()
+    return None
+
+
+def _process_pool(workers):
+    """The process pool every password search shares, started on first use.
+
+    Workers are spawned rather than forked: searches run on the server's
+    request threads, and forking a threaded process copies whatever locks
+    its other threads held at that moment.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool(pool):
+    """Drop a pool whose worker died, so the next search starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def _find_by_opening(source, candidates):
+    if hasattr(source, 'read'):
+        position = source.tell()
+        data = source.read()
+        source.seek(position)
+        source = data
+    for candidate in [''] + [c for c in candidates if c]:
+        fp = io.BytesIO(source) if isinstance(source, (bytes, bytearray, memoryview)) else source
+        try:
+            with pdfplumber.open(fp, password=candidate):
+                return candidate
+        except PdfminerException as e:
+            if not isinstance(e.args[0] if e.args else None, PDFPasswordIncorrect):
+                raise
+    return None
+
+
+def guess_password(source, filename=None, hints=()):
+    """Password for an upload that came without one, or None.
+
+    Unencrypted statements and files pdfminer cannot read at all also give
+    None, leaving the parser to report them.
+    """
+    try:
+        return find_password(source, password_candidates(filename, hints)) or None
+    except (PDFException, PdfminerException, ValueError):
+        return None
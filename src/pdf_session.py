@@ -0,0 +1,171 @@
+import io
+
+import pdfplumber
+from pdfminer.pdftypes import PDFStream
+
+from table_extract import extract_tables
+
+_IN_MEMORY = (bytes, bytearray, memoryview)
+
+
+class PdfSession:
+    """A single opened (and decrypted) PDF shared by every pipeline stage.
+
+    Bank identification and the per-bank parsers used to call
+    ``pdfplumber.open`` independently, so every page was decrypted and laid
+    out twice. A session opens the document once and memoizes per-page text,
+    words and tables, so each page is processed at most once per request.
+
+    ``pdf_path`` may also be the statement's bytes or a binary file object
+    (an upload's ``SpooledTemporaryFile``, say), so an upload never has to
+    be written to disk. ``bytes`` are read in place: the session's buffer
+    shares their memory rather than copying it. For a protected
+    statement the password is used once, here: every stage that shares the
+    session reads objects pdfminer has already decrypted and decoded. On
+    ``close`` those decrypted streams and the key are wiped, and so is the
+    session's copy of a ``bytearray`` or ``memoryview`` source.
+    """
+
+    def __init__(self, pdf_path, password=None):
+        self.pdf_path = pdf_path
+        self.password = password or None
+        self._buffer = None
+        self._pdf = None
+        self._text = {}
+        self._words = {}
+        self._tables = {}
+        self._discarded = set()
+
+    @classmethod
+    def ensure(cls, source, password=None):
+        """Return ``(session, owned)`` for a path or an existing session.
+
+        ``owned`` is True when the session was created here and the caller is
+        responsible for closing it. Parsers use this so they can be called
+        either standalone with a path or from the shared pipeline.
+        """
+        if isinstance(source, cls):
+            return source, False
+        return cls(source, password), True
+
+    @property
+    def pdf(self):
+        if self._pdf is None:
+            source = self.pdf_path
+            if isinstance(source, _IN_MEMORY):
+                self._buffer = source = io.BytesIO(source)
+            self._pdf = pdfplumber.open(source, password=self.password)
+        return self._pdf
+
+    @property
+    def page_count(self):
+        return len(self.pdf.pages)
+
+    def page(self, index):
+        if index in self._discarded:
+            raise ValueError(f"Page {index + 1} was discarded to save memory")
+        return self.pdf.pages[index]
+
+    def page_text(self, index):
+        if index not in self._text:
+            self._text[index] = self.page(index).extract_text() or ''
+        return self._text[index]
+
+    def page_words(self, index, **kwargs):
+        key = (index, _settings_key(kwargs))
+        if key not in self._words:
+            self._words[key] = self.page(index).extract_words(**kwargs)
+        return self._words[key]
+
+    def page_tables(self, index, table_settings=None):
+        key = (index, _settings_key(table_settings))
+        if key not in self._tables:
+            self._tables[key] = extract_tables(self.page(index), table_settings)
+        return self._tables[key]
+
+    def extract_text(self, max_pages=None):
+        """Joined text of the first ``max_pages`` pages (all pages by default)."""
+        count = self.page_count if max_pages is None else min(max_pages, self.page_count)
+        return '\n'.join(self.page_text(i) for i in range(count))
+
+    def release_page(self, index, discard=False):
+        """Drop everything memoized for a page once its rows have been emitted.
+
+        With ``discard`` the page's decoded content streams are dropped too.
+        pdfminer keeps them on the page object for the life of the document,
+        which is what makes memory grow with page count; a discarded page
+        cannot be read again in this session.
+        """
+        for cache in (self._words, self._tables):
+            for key in [key for key in cache if key[0] == index]:
+                del cache[key]
+        if self._pdf is None:
+            return
+        page = self._pdf.pages[index]
+        page.close()
+        if discard:
+            self._text.pop(index, None)
+            page.page_obj.contents = []
+            self._discarded.add(index)
+
+    def release_text(self):
+        self._text.clear()
+
+    def close(self):
+        if self._pdf is not None:
+            _wipe_document(self._pdf)
+            self._pdf.close()
+            self._pdf = None
+        if self._buffer is not None:
+            if not isinstance(self.pdf_path, bytes):
+                _wipe_buffer(self._buffer)
+            self._buffer.close()
+            self._buffer = None
+        self._text.clear()
+        self._words.clear()
+        self._tables.clear()
+        self._discarded.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _wipe_document(pdf):
+    """Drop the decrypted stream data and the key pdfminer holds for a document.
+
+    This reaches into pdfminer internals. Should a pdfminer release change
+    them, the wipe is skipped rather than failing ``close``, which would
+    replace the parse result or the exception already on its way out.
+    """
+    try:
+        doc = pdf.doc
+        for obj, _ in list(doc._cached_objs.values()):
+            if isinstance(obj, PDFStream):
+                obj.data = None
+                obj.rawdata = None
+        doc._cached_objs.clear()
+        doc._parsed_objs.clear()
+        doc.decipher = None
+        # Only pages that were loaded; ``pdf.pages`` would parse the rest now.
+        for page in getattr(pdf, '_pages', []):
+            page.page_obj.contents = []
+    except (AttributeError, TypeError):
+        pass
+
+
+def _wipe_buffer(buffer):
+    # Only for buffers the session copied into: a BytesIO over ``bytes``
+    # would make a fresh copy here just to zero it, leaving the caller's
+    # bytes untouched anyway.
+    view = buffer.getbuffer()
+    view[:] = bytes(len(view))
+    view.release()
+
+
+def _settings_key(settings):
+    if not settings:
+        return ()
+    return tuple(sorted((k, repr(v)) for k, v in settings.items()))
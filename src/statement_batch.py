@@ -0,0 +1,136 @@
+import io
+import multiprocessing
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+MAX_FILES = 60
+MAX_FILE_BYTES = 50 * 1024 * 1024
+MAX_BATCH_BYTES = 256 * 1024 * 1024
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+class BatchError(ValueError):
+    """The batch as a whole cannot be accepted (too many files, bad archive)."""
+
+
+def batch_entries(uploads, max_files=MAX_FILES, max_file_bytes=MAX_FILE_BYTES, max_batch_bytes=MAX_BATCH_BYTES):
+    """Expand ``(filename, data)`` uploads into the statements to parse.
+
+    Zip archives are opened and every PDF inside becomes its own entry,
+    named by its path in the archive, so ``2024/apr.pdf`` and
+    ``2025/apr.pdf`` stay apart. Members are checked against
+    ``max_file_bytes``, and the whole batch against ``max_batch_bytes``,
+    before they are decompressed.
+    """
+    entries, total = [], 0
+    for filename, data in uploads:
+        if filename.lower().endswith('.zip') or zipfile.is_zipfile(io.BytesIO(data)):
+            members = _zip_entries(filename, data, max_file_bytes, max_batch_bytes - total)
+        else:
+            members = [(filename, data)]
+        entries.extend(members)
+        total += sum(len(member) for _, member in members)
+        if len(entries) > max_files:
+            raise BatchError(f"A batch may hold at most {max_files} statements")
+        if total > max_batch_bytes:
+            raise BatchError(f"A batch may hold at most {max_batch_bytes // (1024 * 1024)} MB of statements")
+    return entries
+
+
+def _zip_entries(filename, data, max_file_bytes, max_bytes):
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(data))
+    except zipfile.BadZipFile:
+        raise BatchError(f"{filename} is not a valid zip archive")
+    entries = []
+    with archive:
+        members = [info for info in archive.infolist() if _is_statement(info)]
+        for info in members:
+            if info.file_size > max_file_bytes:
+                raise BatchError(f"{info.filename} in {filename} is too large")
+        if sum(info.file_size for info in members) > max_bytes:
+            raise BatchError(f"{filename} unpacks to more than the batch may hold")
+        for info in members:
+            entries.append((info.filename, archive.read(info)))
+    return entries
+
+
+def _is_statement(info):
+    name = info.filename.rsplit('/', 1)[-1]
+    return not info.is_dir() and name.lower().endswith('.pdf') and not name.startswith('.')
+
+
+def _timed(parse, name, data, password):
+    start = time.perf_counter()
+    try:
+        result, error = parse(data, password), None
+    except Exception as e:
+        result, error = None, str(e)
+    return result, error, round(time.perf_counter() - start, 3)
+
+
+def parse_batch(jobs, parse, workers=1):
+    """Run ``parse(data, password)`` for every ``(name, data, password)`` job.
+
+    Returns one entry per job, in order, with the file name, ``status``
+    (``ok`` or ``error``), the result or error message and the seconds
+    the parse took. A statement that fails, or whose worker dies, only
+    marks its own entry as failed. With ``workers > 1`` the statements
+    are spread across a process pool, as parsing is CPU-bound pdfminer
+    work; ``parse`` must then be a module-level function.
+    """
+    if (workers or 1) <= 1 or len(jobs) <= 1:
+        outcomes = [_timed(parse, *job) for job in jobs]
+    else:
+        pool = _process_pool(workers)
+        futures = [pool.submit(_timed, parse, *job) for job in jobs]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except BrokenProcessPool as e:
+                _discard_pool(pool)
+                outcomes.append((None, f"Worker failed: {e}", None))
+            except Exception as e:
+                outcomes.append((None, f"Worker failed: {e}", None))
+    return [_entry(name, *outcome) for (name, _, _), outcome in zip(jobs, outcomes)]
+
+
+def _process_pool(workers):
+    """The process pool every batch shares, started on first use.
+
+    Workers are spawned rather than forked: forking a threaded server
+    copies whatever locks its other threads held at that moment.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool(pool):
+    """Drop a pool whose worker died, so the next batch starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def _entry(name, result, error, seconds):
+    entry = {'file': name, 'status': 'error' if error else 'ok', 'seconds': seconds}
+    if error:
+        entry['error'] = error
+    else:
+        entry['result'] = result
+    return entry
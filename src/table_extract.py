@@ -0,0 +1,66 @@
+from bisect import bisect_left
+
+from pdfplumber import utils
+from pdfplumber.table import TableSettings
+
+
+def extract_tables(page, table_settings=None):
+    """``page.extract_tables()`` restricted to each table's bounding box.
+
+    pdfplumber's ``Table.extract`` scans every character on the page once
+    per table row, so letterheads, address blocks and footers are paid for
+    on every row of every table. Here the page's characters are first
+    narrowed to the table's bounding box, sorted by their vertical centre
+    once, and each row takes its slice by bisection. Cell text is built
+    with the same ``extract_text`` call on the same characters, and the
+    ``text_*`` settings are passed on to it as ``page.extract_tables``
+    does, so the output is identical.
+    """
+    settings = TableSettings.resolve(table_settings)
+    text_settings = settings.text_settings or {}
+    return [extract_table(table, page.chars, **text_settings) for table in page.find_tables(settings)]
+
+
+def extract_table(table, chars, **text_settings):
+    x0, top, x1, bottom = table.bbox
+    inside = [
+        (_v_mid(char), order, char) for order, char in enumerate(chars)
+        if x0 <= _h_mid(char) < x1 and top <= _v_mid(char) < bottom
+    ]
+    inside.sort(key=lambda item: item[0])
+    mids = [item[0] for item in inside]
+
+    rows = []
+    for row in table.rows:
+        _, row_top, _, row_bottom = row.bbox
+        window = inside[bisect_left(mids, row_top):bisect_left(mids, row_bottom)]
+        # Back in content order, which is the order extract_text expects.
+        row_chars = [char for _, _, char in sorted(window, key=lambda item: item[1])]
+        cells = []
+        for cell in row.cells:
+            if cell is None:
+                cells.append(None)
+                continue
+            cell_chars = [char for char in row_chars if _in_bbox(char, cell)]
+            if not cell_chars:
+                cells.append('')
+                continue
+            kwargs = dict(text_settings)
+            if 'layout' in kwargs:
+                kwargs.update(layout_width=cell[2] - cell[0], layout_height=cell[3] - cell[1], layout_bbox=cell)
+            cells.append(utils.extract_text(cell_chars, **kwargs))
+        rows.append(cells)
+    return rows
+
+
+def _h_mid(char):
+    return (char['x0'] + char['x1']) / 2
+
+
+def _v_mid(char):
+    return (char['top'] + char['bottom']) / 2
+
+
+def _in_bbox(char, bbox):
+    h_mid, v_mid = _h_mid(char), _v_mid(char)
+    return bbox[0] <= h_mid < bbox[2] and bbox[1] <= v_mid < bbox[3]
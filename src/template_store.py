@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+import re
+import threading
+
+from column_template import ColumnTemplate
+
+# Relative column positions are rounded to this many places, so the same
+# layout fingerprints alike across renderings that differ by a point or two.
+POSITION_PRECISION = 2
+
+_LABEL_NOISE = re.compile(r'[^a-z]')
+
+
+def header_fingerprint(template, page_width):
+    """Hash of a header's normalized labels and relative column positions.
+
+    Labels are lowercased with everything but letters removed, so wrapped
+    headers ("Withdrawal\\nAmt.") compare equal. Boundaries are taken as a
+    fraction of the page width.
+    """
+    labels = [_LABEL_NOISE.sub('', (label or '').lower()) for label in template.labels]
+    positions = [f"{x / page_width:.{POSITION_PRECISION}f}" for x in template.boundaries]
+    key = '|'.join(labels) + '#' + ','.join(positions)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+class TemplateStore:
+    """Known statement layouts keyed by their header fingerprint.
+
+    Each entry records the bank, the parser that handled it and the column
+    template, so a repeat format is recognized from its header geometry
+    alone. With ``path`` the store is loaded from and saved to that JSON
+    file; entries are added after a successful parse.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self._load()
+
+    def lookup(self, fingerprint):
+        """``{'bank', 'parser', 'template'}`` for a known layout, or None."""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+        if entry is None:
+            return None
+        return {
+            'bank': entry['bank'],
+            'parser': entry.get('parser'),
+            'template': ColumnTemplate.from_dict(entry['template']),
+        }
+
+    def add(self, fingerprint, bank, template, parser=None):
+        entry = {'bank': bank, 'parser': parser, 'template': template.to_dict()}
+        with self._lock:
+            if self._entries.get(fingerprint) == entry:
+                return
+            self._entries[fingerprint] = entry
+            snapshot = dict(self._entries)
+        self._save(snapshot)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, fingerprint):
+        return fingerprint in self._entries
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def _save(self, entries):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=1)
+        os.replace(temp_path, self.path)
@@ -0,0 +1,444 @@
+import json
+import os
+import re
+import time
+from datetime import datetime
+
+from bank_signatures import DEFAULT_MIN_CONFIDENCE, UNKNOWN_BANK, identify_statement
+from column_template import template_from_tables
+from memory_guard import MemoryGuard
+from page_cache import page_fingerprint
+from page_probe import may_hold_transactions
+from parallel_extract import carry_over, extract_page_tables, is_continuation_row, table_rows
+from parser_registry import get_row_parser
+from pdf_session import PdfSession
+from table_extract import extract_table
+from template_store import header_fingerprint
+from transaction_batch import TransactionBatch
+from word_layout import WORD_LAYOUTS, layout_for_page
+
+_ACCOUNT_NUMBER = re.compile(r'(?:Account\s*(?:Number|No\.?)|A/c\s*No\.?)\s*[:\-]?\s*(\d{6,20})', re.IGNORECASE)
+
+
+class StatementStream:
+    """Yields a statement's transactions page by page.
+
+    ``row_parser`` turns a list of raw table rows into transactions; it is
+    called once per page, so output can be written or rendered while later
+    pages are still being extracted. Without one, the identified bank's
+    row parser is taken from ``parser_registry``; a row parser given with
+    no ``bank_name`` of its own is handed the identified bank, so dates
+    are read with that bank's formats. Rows carried over a page boundary are
+    held back until the next page shows whether they continue, so a parser
+    never sees half a transaction.
+
+    With a ``page_cache`` (a ``PageRowCache``), pages whose content matches
+    one seen before reuse its rows and skip ``extract_tables`` entirely.
+    With ``use_template`` the column boundaries are learned from the page 1
+    header and reused on every continuation page that fits them.
+
+    A ``template_store`` (a ``TemplateStore``) implies ``use_template``: the
+    page 1 header fingerprint is looked up there first, and a known layout
+    names the bank without any text-based identification. Layouts not yet
+    in the store are added once the statement has parsed successfully,
+    provided the bank was passed in or identified with at least
+    ``DEFAULT_MIN_CONFIDENCE``: a guess stored here would name every later
+    statement with that header.
+
+    Banks with a text layout in ``WORD_LAYOUTS`` (no ruled table) are read
+    from the page's words instead of ``extract_tables``.
+
+    With ``skip_pages`` (the default) every page is first probed with
+    ``may_hold_transactions`` and pages without dates and amounts are
+    never extracted; ``skipped_pages`` lists them. Pages are only probed
+    while no transaction is carried over from the previous page.
+
+    Every page's memoized words and tables are released once its rows are
+    emitted. With ``low_memory`` its decoded content is discarded as well,
+    so memory stays flat however long the statement is. ``max_rss_mb``
+    sets a ceiling checked after every page (``MemoryLimitExceeded`` when
+    it cannot be met); with either option the peak RSS is reported. RSS
+    is process-wide, so other requests in the same process count against
+    the ceiling too.
+
+    ``progress``, if given, is called as ``progress(pages_done, page_count)``
+    once the bank is identified and again after every page.
+
+    With ``workers > 1`` the tables of every page are extracted up front by
+    ``extract_page_tables`` across a process pool (pages are still probed
+    first, in the workers), and the rows are then stitched and parsed page
+    by page as usual. This needs a path or bytes source and applies to the
+    plain table path; word layouts and templates stay serial, and the page
+    cache is not consulted.
+    """
+
+    def __init__(self, source, password=None, row_parser=None, bank_name=None, page_cache=None,
+                 use_template=False, template_store=None, parser_id=None, skip_pages=True,
+                 low_memory=False, max_rss_mb=None, workers=1, progress=None):
+        self.session, self._owns_session = PdfSession.ensure(source, password)
+        self.row_parser = row_parser
+        self.bank_name = bank_name
+        self._bank_given = bank_name is not None
+        self.page_cache = page_cache
+        self.use_template = use_template or template_store is not None
+        self.template_store = template_store
+        self.parser_id = parser_id
+        self.template = None
+        self._first_tables = None
+        self._fingerprint = None
+        self.template_pages = 0
+        self.template_fallbacks = 0
+        self.metadata = {}
+        self.page_count = 0
+        self.pages_done = 0
+        self.transaction_count = 0
+        self.cached_pages = 0
+        self.skip_pages = skip_pages
+        self.skipped_pages = []
+        self.probe_seconds = 0.0
+        self.skipped_probe_seconds = 0.0
+        self.extract_seconds = 0.0
+        self.extracted_pages = 0
+        self.low_memory = low_memory
+        self.memory_guard = MemoryGuard(max_rss_mb) if low_memory or max_rss_mb is not None else None
+        self.workers = workers
+        self.progress = progress
+        self._prefetched = None
+
+    def identify(self):
+        """Identify the bank and fill in header metadata; cheap, page 1 only."""
+        if self.metadata:
+            return self.bank_name
+        self.page_count = self.session.page_count
+        if self.template_store is not None and self.page_count:
+            self._match_layout()
+        if self.bank_name is None:
+            self.bank_name, confidence, pages_scanned = identify_statement(self.session)
+            self.metadata['identification_confidence'] = confidence
+            self.metadata['identification_pages'] = pages_scanned
+        first_page = self.session.page_text(0) if self.page_count else ''
+        match = _ACCOUNT_NUMBER.search(first_page)
+        self.metadata['account_number'] = match.group(1) if match else None
+        self.metadata['total_pages'] = self.page_count
+        if self.row_parser is None:
+            self.row_parser = get_row_parser(self.bank_name)
+        elif getattr(self.row_parser, 'bank_name', False) is None:
+            self.row_parser.bank_name = self.bank_name
+        return self.bank_name
+
+    def _match_layout(self):
+        page = self.session.page(0)
+        self._first_tables = page.find_tables()
+        self.template = template_from_tables(self._first_tables)
+        if self.template is None:
+            self.metadata['template_match'] = False
+            return
+        self._fingerprint = header_fingerprint(self.template, page.width)
+        entry = self.template_store.lookup(self._fingerprint)
+        self.metadata['template_match'] = entry is not None
+        if entry is None:
+            return
+        self.template = entry['template']
+        self.parser_id = self.parser_id or entry['parser']
+        if self.bank_name is None:
+            self.bank_name = entry['bank']
+            self.metadata['identification_confidence'] = 1.0
+            self.metadata['identification_pages'] = 1
+        if self.parser_id:
+            self.metadata['parser'] = self.parser_id
+
+    def _remember_layout(self):
+        if (self.template_store is None or self._fingerprint is None or not self.transaction_count
+                or self.bank_name in (None, UNKNOWN_BANK)):
+            return
+        if not self._bank_given and self.metadata.get('identification_confidence', 0) < DEFAULT_MIN_CONFIDENCE:
+            return
+        self.template_store.add(self._fingerprint, self.bank_name, self.template, self.parser_id)
+
+    def __iter__(self):
+        self.identify()
+        try:
+            self._report_progress()
+            self._prefetched = self._prefetch()
+            pending = []
+            for index in range(self.page_count):
+                rows = self._page_rows(index, carrying=self._carries_transaction(pending))
+                if pending:
+                    pending[-1], rows = carry_over(pending[-1], rows)
+                rows = pending + rows
+                split = _last_transaction_start(rows)
+                ready, pending = rows[:split], rows[split:]
+                yield from self._parse(ready)
+                self.pages_done = index + 1
+                self._report_progress()
+                self.session.release_page(index, discard=self.low_memory)
+                if self.memory_guard is not None:
+                    self.memory_guard.check(reclaim=self.session.release_text)
+            yield from self._parse(pending)
+            self._remember_layout()
+        finally:
+            self.close()
+
+    def _report_progress(self):
+        if self.progress is not None:
+            self.progress(self.pages_done, self.page_count)
+
+    def close(self):
+        if self._owns_session:
+            self.session.close()
+
+    def _prefetch(self):
+        source = self.session.pdf_path
+        if ((self.workers or 1) <= 1 or self.use_template or self.bank_name in WORD_LAYOUTS
+                or not isinstance(source, (str, bytes, os.PathLike))):
+            return None
+        started = time.perf_counter()
+        probe = may_hold_transactions if self.skip_pages else None
+        tables = extract_page_tables(source, self.session.password, self.workers, probe=probe)
+        self.extract_seconds += time.perf_counter() - started
+        return tables
+
+    def _carries_transaction(self, pending):
+        """Whether the rows held back from earlier pages make up a transaction.
+
+        A footer such as "Statement generated on" is held back like any
+        other last row, but nothing can continue it.
+        """
+        return bool(pending) and next(iter(self.row_parser(pending)), None) is not None
+
+    def _page_rows(self, index, carrying=False):
+        """Rows of one page; ``carrying`` when a transaction is held back.
+
+        A page is never skipped while a transaction is carried over: a page
+        of nothing but narration continuing it has no date and often no
+        amount, and skipping it would cut the narration short.
+        """
+        if self._prefetched is not None:
+            tables = self._prefetched[index]
+            self._prefetched[index] = None
+            if tables is not None:
+                self.extracted_pages += 1
+                return table_rows(tables)
+            if not carrying:
+                self.skipped_pages.append(index)
+                return []
+            return self._timed_extract(index)
+        if self.skip_pages and not carrying:
+            started = time.perf_counter()
+            keep = may_hold_transactions(self.session.page(index))
+            elapsed = time.perf_counter() - started
+            self.probe_seconds += elapsed
+            if not keep:
+                self.skipped_pages.append(index)
+                self.skipped_probe_seconds += elapsed
+                return []
+            # Reading the characters is the first step of extraction too.
+            self.extract_seconds += elapsed
+        if self.page_cache is None:
+            return self._timed_extract(index)
+        page = self.session.page(index)
+        fingerprint = page_fingerprint(page, extra=self._cache_extra(page))
+        rows = self.page_cache.get(fingerprint)
+        if rows is not None:
+            self.cached_pages += 1
+            return rows
+        rows = self._timed_extract(index)
+        self.page_cache.put(fingerprint, rows)
+        return rows
+
+    def _cache_extra(self, page):
+        """The bank and extraction path that rows cached for ``page`` came from.
+
+        The same page bytes give different rows through a word layout, a
+        learned template (identified by its header fingerprint) or plain
+        table extraction, so all of them are part of the cache key.
+        """
+        if self.bank_name in WORD_LAYOUTS:
+            path = 'words'
+        elif self.use_template:
+            path = 'template:' + (header_fingerprint(self.template, page.width) if self.template is not None else '')
+        else:
+            path = 'tables'
+        return f"{self.bank_name}|{path}"
+
+    def _timed_extract(self, index):
+        started = time.perf_counter()
+        rows = self._extract_rows(index)
+        self.extract_seconds += time.perf_counter() - started
+        self.extracted_pages += 1
+        return rows
+
+    def probe_stats(self):
+        """Skipped pages and the extraction time they are estimated to have saved.
+
+        The saving is the mean extraction time of the pages that were
+        extracted, times the number skipped, less the time spent probing
+        the skipped pages.
+        """
+        mean = self.extract_seconds / self.extracted_pages if self.extracted_pages else 0.0
+        saved = mean * len(self.skipped_pages) - self.skipped_probe_seconds
+        return {
+            'skipped_pages': list(self.skipped_pages),
+            'probe_seconds': round(self.probe_seconds, 4),
+            'estimated_seconds_saved': round(max(saved, 0.0), 4),
+        }
+
+    def _extract_rows(self, index):
+        if self.bank_name in WORD_LAYOUTS:
+            words = self.session.page_words(index)
+            layout = layout_for_page(self.bank_name, words)
+            if layout is not None:
+                # The layout's labels lead its rows, as a ruled table's header row would.
+                return [list(layout.columns)] + layout.rows(words)
+        if not self.use_template:
+            return table_rows(self.session.page_tables(index))
+        page = self.session.page(index)
+        if index == 0 or self.template is None:
+            tables = self._first_tables if index == 0 and self._first_tables is not None else page.find_tables()
+            self._first_tables = None
+            if self.template is None:
+                self.template = template_from_tables(tables)
+            return table_rows(extract_table(table, page.chars) for table in tables)
+        rows = self.template.extract(page)
+        if rows is None:
+            self.template_fallbacks += 1
+            return table_rows(self.session.page_tables(index))
+        self.template_pages += 1
+        return rows
+
+    def _parse(self, rows):
+        if not rows:
+            return
+        for transaction in self.row_parser(rows):
+            self.transaction_count += 1
+            yield transaction
+
+    def summary(self):
+        return {
+            'bank_name': self.bank_name,
+            'total_transactions': self.transaction_count,
+            'pages_done': self.pages_done,
+            'total_pages': self.page_count,
+            'cached_pages': self.cached_pages,
+            'template_pages': self.template_pages,
+            'template_fallbacks': self.template_fallbacks,
+            **self.probe_stats(),
+            **self.memory_stats(),
+        }
+
+    def memory_stats(self):
+        if self.memory_guard is None:
+            return {}
+        return {'peak_rss_mb': self.memory_guard.peak_mb, 'max_rss_mb': self.memory_guard.max_rss_mb}
+
+
+def _last_transaction_start(rows):
+    """Index of the last row that starts a transaction (not a continuation)."""
+    for i in range(len(rows) - 1, -1, -1):
+        if not is_continuation_row(rows[i]):
+            return i
+    return 0
+
+
+def transaction_to_dict(transaction):
+    if isinstance(transaction, dict):
+        return transaction
+    if hasattr(transaction, 'to_dict'):
+        return transaction.to_dict()
+    return dict(vars(transaction))
+
+
+def ndjson_lines(stream):
+    """Newline-delimited JSON for a ``StatementStream``, one line at a time.
+
+    A ``metadata`` line (bank, account number, page count) is produced as
+    soon as the bank is identified, then one ``transaction`` line per
+    transaction as its page completes, then a ``summary`` line. Nothing
+    but the current line is ever serialized, so a long statement never
+    exists as one JSON string. A failure part-way through ends the output
+    with an ``error`` line, since the response status has already gone.
+    """
+    try:
+        stream.identify()
+        yield _ndjson({'type': 'metadata', 'bank_name': stream.bank_name, 'metadata': stream.metadata})
+        for transaction in stream:
+            yield _ndjson({'type': 'transaction', 'transaction': transaction_to_dict(transaction)})
+        yield _ndjson({'type': 'summary', **stream.summary()})
+    except Exception as e:
+        yield _ndjson({'type': 'error', 'error': str(e)})
+    finally:
+        stream.close()
+
+
+def result_lines(result):
+    """The ``ndjson_lines`` form of an already collected result dict."""
+    yield _ndjson({'type': 'metadata', 'bank_name': result.get('bank_name'), 'metadata': result.get('metadata') or {}})
+    for transaction in result.get('transactions') or []:
+        yield _ndjson({'type': 'transaction', 'transaction': transaction})
+    yield _ndjson({'type': 'summary', 'bank_name': result.get('bank_name'),
+                   'total_transactions': result.get('total_transactions', len(result.get('transactions') or []))})
+
+
+def _ndjson(record):
+    return json.dumps(record, default=str) + '\n'
+
+
+def collect_batch(stream):
+    """Drain a ``StatementStream`` into a columnar ``TransactionBatch``."""
+    batch = TransactionBatch()
+    for transaction in stream:
+        batch.append_transaction(transaction)
+    return batch
+
+
+def iter_transactions(source, password=None, row_parser=None, bank_name=None, page_cache=None,
+                      use_template=False, template_store=None, parser_id=None, skip_pages=True,
+                      low_memory=False, max_rss_mb=None, workers=1, progress=None):
+    """Generator over the transactions of a statement, one page at a time."""
+    return iter(StatementStream(source, password, row_parser, bank_name, page_cache, use_template,
+                                template_store, parser_id, skip_pages, low_memory, max_rss_mb, workers,
+                                progress))
+
+
+def parse_statement(source, password=None, row_parser=None, bank_name=None, page_cache=None,
+                    use_template=False, template_store=None, parser_id=None, skip_pages=True,
+                    low_memory=False, max_rss_mb=None, workers=1, progress=None):
+    """Collect a whole statement into the JSON result dict."""
+    stream = StatementStream(source, password, row_parser, bank_name, page_cache, use_template,
+                             template_store, parser_id, skip_pages, low_memory, max_rss_mb, workers,
+                             progress)
+    transactions = [transaction_to_dict(tx) for tx in stream]
+    metadata = dict(stream.metadata)
+    if page_cache is not None:
+        metadata['cached_pages'] = stream.cached_pages
+    if stream.use_template:
+        metadata['template_pages'] = stream.template_pages
+        metadata['template_fallbacks'] = stream.template_fallbacks
+    if skip_pages:
+        metadata.update(stream.probe_stats())
+    metadata.update(stream.memory_stats())
+    metadata['parsed_at'] = datetime.now().isoformat()
+    return {
+        'bank_name': stream.bank_name,
+        'total_transactions': len(transactions),
+        'transactions': transactions,
+        'metadata': metadata,
+    }
+
+
+class StreamingStatementParser:
+    """Statement parser with the ``parse_statement`` interface, built on ``StatementStream``.
+
+    Each bank's rows are read by its row parser from ``parser_registry``.
+    ``stream`` gives the same transactions page by page, so a caller can
+    send them on as they complete and still match ``parse_statement``.
+    ``progress`` is passed on to the stream's ``progress`` callback.
+    """
+
+    parser_id = 'header-rows'
+
+    def parse_statement(self, pdf_path, password=None, progress=None):
+        return parse_statement(pdf_path, password, progress=progress)
+
+    def stream(self, pdf_path, password=None):
+        return StatementStream(pdf_path, password)
@@ -0,0 +1,151 @@
+import re
+
+import numpy as np
+
+DEFAULT_LINE_TOLERANCE = 2.0
+DEFAULT_ATTACH_DISTANCE = 20.0
+
+
+class WordLayout:
+    """Rebuilds a statement's transaction rows from ``page.extract_words()``.
+
+    Text-layout statements (Yes Bank) draw no ruling, print descriptions
+    and reference numbers over several lines, and centre the date line
+    among them, so ``extract_tables`` splits one transaction into several
+    rows or runs cells together. Instead, words are clustered into lines
+    by their ``top``, into columns by fixed x ``edges``, and every line is
+    attached to the nearest line whose ``anchor`` column matches
+    ``anchor_pattern`` (a transaction's date), or with ``attach='following'``
+    to the anchor above it, for layouts that start each transaction on its
+    date line and wrap the rest below. Lines further than
+    ``attach_distance`` from any anchor, such as letterheads and footers,
+    are dropped, as is everything down to the last header line matching
+    ``start_after``. ``header`` is a pattern found in the page's words
+    when it is printed in this layout, for banks with several formats.
+
+    ``rows`` returns the same list-of-cells rows as a table extraction, one
+    per transaction with multi-line cells joined by newlines, so existing
+    row parsers and page stitching work unchanged.
+    """
+
+    def __init__(self, columns, edges, anchor, anchor_pattern, start_after=None, header=None, attach='nearest',
+                 line_tolerance=DEFAULT_LINE_TOLERANCE, attach_distance=DEFAULT_ATTACH_DISTANCE):
+        if len(columns) != len(edges):
+            raise ValueError("Each column needs exactly one left edge")
+        if attach not in ('nearest', 'following'):
+            raise ValueError(f"Unknown attach mode: {attach}")
+        self.attach = attach
+        self.columns = list(columns)
+        self.edges = np.asarray(edges, dtype=float)
+        self.anchor = self.columns.index(anchor)
+        self.anchor_pattern = re.compile(anchor_pattern)
+        self.start_after = re.compile(start_after) if start_after else None
+        self.header = re.compile(header) if header else None
+        self.line_tolerance = line_tolerance
+        self.attach_distance = attach_distance
+
+    def page_rows(self, page):
+        return self.rows(page.extract_words())
+
+    def rows(self, words):
+        if not words:
+            return []
+        x0 = np.fromiter((w['x0'] for w in words), dtype=float, count=len(words))
+        x1 = np.fromiter((w['x1'] for w in words), dtype=float, count=len(words))
+        top = np.fromiter((w['top'] for w in words), dtype=float, count=len(words))
+
+        order = np.lexsort((x0, top))
+        top = top[order]
+        line_of = np.concatenate(([0], np.cumsum(np.diff(top) > self.line_tolerance)))
+        column_of = np.searchsorted(self.edges, (x0[order] + x1[order]) / 2, side='right') - 1
+        column_of = np.clip(column_of, 0, len(self.columns) - 1)
+
+        line_count = int(line_of[-1]) + 1
+        cells = [[[] for _ in self.columns] for _ in range(line_count)]
+        for position, index in enumerate(order):
+            cells[line_of[position]][column_of[position]].append(words[index]['text'])
+        lines = [[' '.join(cell) for cell in line] for line in cells]
+        line_top = top[np.searchsorted(line_of, np.arange(line_count))]
+
+        is_anchor = np.array([bool(self.anchor_pattern.match(line[self.anchor])) for line in lines])
+        first = self._first_line(lines, is_anchor)
+        is_anchor[:first] = False
+        anchors = np.flatnonzero(is_anchor)
+        if not len(anchors):
+            return []
+
+        owner = self._nearest_anchor(line_top, anchors)
+        owner[:first] = -1
+        records = {int(anchor): [[] for _ in self.columns] for anchor in anchors}
+        for i in np.flatnonzero(owner >= 0):
+            record = records[int(owner[i])]
+            for column, text in enumerate(lines[i]):
+                if text:
+                    record[column].append(text)
+        return [['\n'.join(cell) for cell in records[int(anchor)]] for anchor in anchors]
+
+    def _first_line(self, lines, is_anchor):
+        """Index of the first line below the header, which may span several lines."""
+        if self.start_after is None:
+            return 0
+        first = 0
+        for i, line in enumerate(lines):
+            if is_anchor[i] and first:
+                break
+            if self.start_after.search(' '.join(cell for cell in line if cell)):
+                first = i + 1
+        return first
+
+    def _nearest_anchor(self, line_top, anchors):
+        """Index of the closest anchor line for every line, or -1 if too far."""
+        anchor_top = line_top[anchors]
+        if self.attach == 'following':
+            before = np.searchsorted(anchor_top, line_top, side='right') - 1
+            distance = line_top - anchor_top[np.clip(before, 0, None)]
+            return np.where((before >= 0) & (distance <= self.attach_distance), anchors[np.clip(before, 0, None)], -1)
+        after = np.clip(np.searchsorted(anchor_top, line_top), 0, len(anchors) - 1)
+        before = np.clip(after - 1, 0, len(anchors) - 1)
+        after_distance = np.abs(anchor_top[after] - line_top)
+        before_distance = np.abs(line_top - anchor_top[before])
+        nearest = np.where(before_distance <= after_distance, before, after)
+        distance = np.minimum(before_distance, after_distance)
+        return np.where(distance <= self.attach_distance, anchors[nearest], -1)
+
+
+# Column left edges per bank, measured from the statements' header rows.
+# A bank may print more than one format; the first layout whose header
+# appears on the page is used.
+WORD_LAYOUTS = {
+    'YES': [WordLayout(
+        columns=['Transaction Date', 'Value Date', 'Cheque No/Reference No', 'Description',
+                 'Withdrawals', 'Deposits', 'Running Balance'],
+        edges=[0, 140, 240, 428, 600, 645, 681],
+        anchor='Transaction Date',
+        anchor_pattern=r'^\d{2}-[A-Za-z]{3}-\d{4}$',
+        start_after=r'Transaction Date\s+Value Date|^(?:Running|Balance)$',
+        header=r'Cheque No/ Reference No',
+    ), WordLayout(
+        # Current-account export: ISO dates, each transaction wrapped below its date line.
+        columns=['Transaction Date', 'Value Date', 'Description', 'Reference Number',
+                 'Withdrawals', 'Deposits', 'Running Balance'],
+        edges=[0, 75, 125, 240, 335, 425, 495],
+        anchor='Transaction Date',
+        anchor_pattern=r'^\d{4}-\d{2}-\d{2}$',
+        start_after=r'^Transaction\s+Value\s*Date|^Date$',
+        header=r'Description Reference Number',
+        attach='following',
+        attach_distance=120.0,
+    )],
+}
+
+
+def layout_for_page(bank_name, words):
+    """The bank's layout whose header appears in ``words``, or None."""
+    layouts = WORD_LAYOUTS.get(bank_name, [])
+    if len(layouts) < 2:
+        return layouts[0] if layouts else None
+    text = ' '.join(word['text'] for word in words)
+    for layout in layouts:
+        if layout.header is None or layout.header.search(text):
+            return layout
+    return None
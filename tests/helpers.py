@@ -0,0 +1,46 @@
+"""Sample statements and row parsers shared by the test modules."""
+import os
+import re
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+AXIS_PDF = os.path.join(ROOT, 'Axis_Bank.PDF')
+BANDHAN_PDF = os.path.join(ROOT, 'Bandhan_bank.pdf')
+CBI_PDF = os.path.join(ROOT, 'CBI.pdf')
+IDBI_PDF = os.path.join(ROOT, 'IDBI_99128926.PDF')
+IDBI_2_PDF = os.path.join(ROOT, 'IDBI_Bank_2.pdf')
+IOB_PDF = os.path.join(ROOT, 'Indian_Overseas_bank_51087192.pdf')
+JK_PDF = os.path.join(ROOT, 'JK_BANK.pdf')
+KOTAK_PDF = os.path.join(ROOT, 'Kotak_Bank.pdf')
+YES_PDF = os.path.join(ROOT, 'YEs Bank_RetailAccountStatement_638897583636443274.pdf')
+YES_CURRENT_PDF = os.path.join(ROOT, 'Statement-079561900004248-07-30-2025-17-06-53 (1).pdf')
+
+BANDHAN_DATE = re.compile(r'^[A-Z][a-z]+\d{1,2}, \d{4}$')
+
+
+def bandhan_rows(rows):
+    for row in rows:
+        if len(row) >= 6 and BANDHAN_DATE.match((row[0] or '').strip()):
+            yield {'date': row[0], 'description': row[2], 'amount': row[3], 'balance': row[5]}
+
+
+def yes_rows(rows):
+    for row in rows:
+        if row[0] == 'Transaction Date':
+            continue
+        yield {'date': row[0], 'description': row[2] + ' ' + row[3], 'balance': row[-1]}
+
+
+def balance_breaks(transactions):
+    """Indexes of rows whose balance does not follow from the row before.
+
+    Statements list oldest or newest first, so either order is accepted.
+    """
+    breaks = []
+    for i in range(1, len(transactions)):
+        before, after = transactions[i - 1], transactions[i]
+        ascending = before['balance'] + after['credit'] - after['debit']
+        descending = after['balance'] + before['credit'] - before['debit']
+        if abs(ascending - after['balance']) >= 0.005 and abs(descending - before['balance']) >= 0.005:
+            breaks.append(i)
+    return breaks
@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from amount_normalizer import normalize_amounts, normalize_columns, split_debit_credit
+
+
+class TestAmountNormalizer(unittest.TestCase):
+    def test_indian_formats(self):
+        amounts, errors = normalize_amounts(['1,00,102.03', 'INR34,279.01', 'INR.76', '-', '', None, '500,000.00'])
+        self.assertEqual(list(amounts), [10010203, 3427901, 76, 0, 0, 0, 50000000])
+        self.assertFalse(errors.any())
+
+    def test_balance_side_suffixes(self):
+        amounts, errors = normalize_amounts(['9196.50 CR', '443359.49Cr', '33,816.66(Cr)', '1,200.00 Dr'])
+        self.assertEqual(list(amounts), [919650, 44335949, 3381666, -120000])
+        self.assertFalse(errors.any())
+
+    def test_exact_paise_without_float_rounding(self):
+        amounts, errors = normalize_amounts(['0.29', '1,23,45,678.91', '10.005', '-5.5', '.5'])
+        self.assertEqual(amounts.dtype.name, 'int64')
+        self.assertEqual(list(amounts), [29, 1234567891, 1001, -550, 50])
+        self.assertFalse(errors.any())
+
+    def test_unreadable_cells_are_flagged(self):
+        amounts, errors = normalize_amounts(['12.50', 'Transfer', 'S17784934'])
+        self.assertEqual(list(errors), [False, True, True])
+        self.assertEqual(amounts[1], 0)
+
+    def test_oversized_cell_is_flagged_not_raised(self):
+        amounts, errors = normalize_amounts(['12.50', '99999999999999999999', '0009999999999999999.99'])
+        self.assertEqual(list(errors), [False, True, False])
+        self.assertEqual(list(amounts), [1250, 0, 999999999999999999])
+
+    def test_bandhan_amount_and_dr_cr(self):
+        debit, credit, errors = split_debit_credit(['INR2.30', 'INR60,000.00', 'INR5.00'], ['Dr', 'Cr', ''])
+        self.assertEqual(list(debit), [230, 0, 0])
+        self.assertEqual(list(credit), [0, 6000000, 0])
+        self.assertEqual(list(errors), [False, False, True])
+
+    def test_normalize_columns(self):
+        columns = normalize_columns(debit=['2,000.00', '-'], credit=['-', '1,356.95'], balance=['1,00,102.03', '1,02,158.03'])
+        self.assertEqual(list(columns['debit']), [200000, 0])
+        self.assertEqual(list(columns['credit']), [0, 135695])
+        self.assertEqual(list(columns['balance']), [10010203, 10215803])
+        self.assertFalse(columns['errors'].any())
+
+    def test_amount_requires_indicator(self):
+        with self.assertRaises(ValueError):
+            normalize_columns(amount=['1.00'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,255 @@
+import io
+import json
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from api import index
+from parse_cache import make_cache_key
+import transaction_stream
+from transaction_stream import StatementStream, StreamingStatementParser
+from helpers import BANDHAN_PDF, IDBI_PDF
+
+
+IOB_RESULT = {
+    'bank_name': 'IOB',
+    'total_transactions': 1,
+    'transactions': [{'date': '2025-03-31', 'description': 'GST', 'debit': 2.3, 'credit': 0.0, 'balance': 10.0}],
+    'metadata': {'account_number': '327401000005092'},
+}
+
+
+class CountingParser:
+    calls = 0
+    password = None
+    source = None
+
+    def parse_statement(self, pdf_path, password=None):
+        CountingParser.calls += 1
+        CountingParser.password = password
+        # Like pdfplumber.open, read whatever file object it is handed.
+        CountingParser.source = pdf_path.read()
+        return IOB_RESULT
+
+
+class TestParseEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.original_parser = index.IndianBankStatementParser
+        index.IndianBankStatementParser = CountingParser
+        CountingParser.calls = 0
+        index.parse_cache.clear()
+        self.client = index.app.test_client()
+
+    def tearDown(self):
+        index.IndianBankStatementParser = self.original_parser
+
+    def upload(self, data=b'%PDF-1.4 sample', password=''):
+        return self.client.post('/api/parse', data={
+            'pdf': (io.BytesIO(data), 'statement.pdf'),
+            'password': password,
+        }, content_type='multipart/form-data')
+
+    def test_repeat_upload_is_served_from_cache(self):
+        first = self.upload().get_json()
+        second = self.upload().get_json()
+        self.assertEqual(first['metadata']['cache'], 'miss')
+        self.assertEqual(second['metadata']['cache'], 'hit')
+        self.assertEqual(CountingParser.calls, 1)
+
+    def test_upload_is_parsed_from_memory(self):
+        self.upload(data=b'%PDF-1.4 in memory')
+        self.assertEqual(CountingParser.source, b'%PDF-1.4 in memory')
+
+    def test_password_is_part_of_cache_key(self):
+        self.upload(password='51087192')
+        self.assertEqual(self.upload().get_json()['metadata']['cache'], 'miss')
+
+    def test_cache_is_keyed_by_parser(self):
+        class FallbackParser(CountingParser):
+            parser_id = 'header-rows'
+
+        self.upload()
+        index.IndianBankStatementParser = FallbackParser
+        self.assertEqual(self.upload().get_json()['metadata']['cache'], 'miss')
+        index.IndianBankStatementParser = CountingParser
+        self.assertEqual(self.upload().get_json()['metadata']['cache'], 'hit')
+        self.assertEqual(CountingParser.calls, 2)
+
+    def test_password_is_guessed_from_filename(self):
+        if not os.path.exists(IDBI_PDF):
+            self.skipTest('sample PDF not available')
+        with open(IDBI_PDF, 'rb') as f:
+            data = f.read()
+        self.client.post('/api/parse', data={'pdf': (io.BytesIO(data), 'IDBI_99128926.PDF')},
+                         content_type='multipart/form-data')
+        self.assertEqual(CountingParser.password, '99128926')
+
+    def submit(self, data, filename='statement.pdf'):
+        response = self.client.post('/api/jobs', data={'pdf': (io.BytesIO(data), filename)},
+                                    content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 202)
+        job_id = response.get_json()['id']
+        self.assertEqual(response.headers['Location'], f'/api/jobs/{job_id}')
+        index.job_queue.wait(job_id, timeout=60)
+        return self.client.get(f'/api/jobs/{job_id}').get_json()
+
+    def test_job_uses_the_parse_endpoint_parser_and_cache(self):
+        status = self.submit(b'%PDF-1.4 job')
+        self.assertEqual(status['status'], 'done')
+        self.assertEqual(status['result']['transactions'], IOB_RESULT['transactions'])
+        self.assertEqual(self.upload(data=b'%PDF-1.4 job').get_json()['metadata']['cache'], 'hit')
+        self.assertEqual(CountingParser.calls, 1)
+
+    def test_job_is_parsed_in_background(self):
+        if not os.path.exists(BANDHAN_PDF):
+            self.skipTest('sample PDF not available')
+        index.IndianBankStatementParser = StreamingStatementParser
+        with open(BANDHAN_PDF, 'rb') as f:
+            data = f.read()
+        status = self.submit(data, 'Bandhan_bank.pdf')
+        self.assertEqual(status['status'], 'done')
+        self.assertEqual(status['result']['bank_name'], 'BANDHAN')
+        self.assertEqual(status['result']['total_transactions'], 158)
+        pages = status['result']['metadata']['total_pages']
+        self.assertEqual(status['progress'], {'pages_done': pages, 'pages_total': pages})
+
+    def test_full_job_queue_is_refused(self):
+        original = index.job_queue.max_pending
+        index.job_queue.max_pending = 0
+        try:
+            response = self.client.post('/api/jobs', data={'pdf': (io.BytesIO(b'%PDF-1.4'), 'statement.pdf')},
+                                        content_type='multipart/form-data')
+        finally:
+            index.job_queue.max_pending = original
+        self.assertEqual(response.status_code, 503)
+
+    def test_unknown_job(self):
+        self.assertEqual(self.client.get('/api/jobs/nope').status_code, 404)
+
+    def test_batch_reports_each_file(self):
+        index.parse_cache.clear()
+        response = self.client.post('/api/batch', data={
+            'pdf': [(io.BytesIO(b'%PDF-1.4 april'), 'april.pdf'), (io.BytesIO(b'%PDF-1.4 may'), 'may.pdf')],
+            'passwords': '{"april.pdf": "51087192"}',
+        }, content_type='multipart/form-data')
+        data = response.get_json()
+        self.assertEqual([entry['file'] for entry in data['files']], ['april.pdf', 'may.pdf'])
+        self.assertEqual(data['succeeded'], 2)
+        self.assertEqual(data['files'][0]['result']['metadata']['cache'], 'miss')
+        again = self.client.post('/api/batch', data={'pdf': (io.BytesIO(b'%PDF-1.4 may'), 'may.pdf')},
+                                 content_type='multipart/form-data').get_json()
+        self.assertEqual(again['files'][0]['result']['metadata']['cache'], 'hit')
+
+    def test_batch_rejects_bad_password_map(self):
+        response = self.client.post('/api/batch', data={
+            'pdf': (io.BytesIO(b'%PDF-1.4'), 'a.pdf'), 'passwords': '[1]',
+        }, content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 400)
+
+    def stream(self, data=b'%PDF-1.4', filename='statement.pdf'):
+        response = self.client.post('/api/parse?stream=1', data={'pdf': (io.BytesIO(data), filename)},
+                                    content_type='multipart/form-data')
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_cached_result_is_replayed_as_stream(self):
+        index.parse_cache.put(make_cache_key(b'%PDF-1.4'), IOB_RESULT)
+        records = self.stream()
+        self.assertEqual([record['type'] for record in records], ['metadata', 'transaction', 'summary'])
+        self.assertEqual(records[0]['metadata']['account_number'], '327401000005092')
+        self.assertEqual(records[1]['transaction']['description'], 'GST')
+        self.assertEqual(CountingParser.calls, 0)
+
+    def test_stream_uses_the_parse_endpoint_parser(self):
+        records = self.stream()
+        self.assertEqual([record['transaction'] for record in records if record['type'] == 'transaction'],
+                         IOB_RESULT['transactions'])
+        self.assertEqual(CountingParser.calls, 1)
+        self.assertEqual(self.upload(data=b'%PDF-1.4').get_json()['metadata']['cache'], 'hit')
+
+    def test_streaming_parser_matches_parse_response(self):
+        if not os.path.exists(BANDHAN_PDF):
+            self.skipTest('sample PDF not available')
+        index.IndianBankStatementParser = StreamingStatementParser
+        with open(BANDHAN_PDF, 'rb') as f:
+            data = f.read()
+        records = self.stream(data, 'Bandhan_bank.pdf')
+        parsed = self.upload(data=data).get_json()
+        self.assertEqual([record['transaction'] for record in records if record['type'] == 'transaction'],
+                         parsed['transactions'])
+        self.assertEqual(records[-1]['total_transactions'], 158)
+
+    def test_lines_are_sent_before_the_last_page_is_parsed(self):
+        if not os.path.exists(BANDHAN_PDF):
+            self.skipTest('sample PDF not available')
+        streams = []
+
+        class RecordingStream(StatementStream):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                streams.append(self)
+
+        index.IndianBankStatementParser = StreamingStatementParser
+        original = transaction_stream.StatementStream
+        transaction_stream.StatementStream = RecordingStream
+        try:
+            with open(BANDHAN_PDF, 'rb') as f:
+                data = f.read()
+            response = self.client.post('/api/parse', data={'pdf': (io.BytesIO(data), 'Bandhan_bank.pdf')},
+                                        headers={'Accept': 'application/x-ndjson'}, content_type='multipart/form-data')
+            lines = iter(response.response)
+            metadata, first = json.loads(next(lines)), json.loads(next(lines))
+            self.assertEqual(metadata['bank_name'], 'BANDHAN')
+            self.assertEqual(first['transaction']['description'], 'GST')
+            self.assertLess(streams[0].pages_done, streams[0].page_count)
+            records = [json.loads(line) for line in lines]
+        finally:
+            transaction_stream.StatementStream = original
+            response.close()
+        self.assertEqual(records[-1]['type'], 'summary')
+        self.assertEqual(records[-1]['total_transactions'], 158)
+        self.assertEqual(streams[0].pages_done, streams[0].page_count)
+
+    def test_columnar_pages(self):
+        first = self.client.post('/api/parse?format=columnar&limit=1', data={
+            'pdf': (io.BytesIO(b'%PDF-1.4 sample'), 'statement.pdf'),
+        }, content_type='multipart/form-data').get_json()
+        self.assertEqual(first['columns']['description'], ['GST'])
+        self.assertEqual(first['matched'], 1)
+        self.assertNotIn('transactions', first)
+        result_id = first['result_id']
+        page = self.client.get(f'/api/results/{result_id}?q=gst&type=debit&sort=balance&order=desc').get_json()
+        self.assertEqual(page['columns']['debit'], [2.3])
+        self.assertEqual(self.client.get(f'/api/results/{result_id}?q=neft').get_json()['matched'], 0)
+        self.assertEqual(self.client.get(f'/api/results/{result_id}?limit=x').status_code, 400)
+        download = self.client.get(f'/api/results/{result_id}/download')
+        self.assertEqual(len(download.get_json()['transactions']), 1)
+        self.assertEqual(self.client.get('/api/results/unknown').status_code, 404)
+
+    def test_columnar_page_when_result_is_not_kept(self):
+        original = index.parse_cache.max_entries
+        index.parse_cache.max_entries = 0
+        try:
+            first = self.client.post('/api/parse?format=columnar', data={
+                'pdf': (io.BytesIO(b'%PDF-1.4 sample'), 'statement.pdf'),
+            }, content_type='multipart/form-data')
+            result_id = first.get_json()['result_id']
+            page = self.client.get(f'/api/results/{result_id}')
+            download = self.client.get(f'/api/results/{result_id}/download')
+        finally:
+            index.parse_cache.max_entries = original
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.get_json()['columns']['description'], ['GST'])
+        self.assertEqual(page.status_code, 410)
+        self.assertIn('expired', page.get_json()['error'])
+        self.assertEqual(download.status_code, 410)
+
+    def test_missing_file(self):
+        response = self.client.post('/api/parse', data={})
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
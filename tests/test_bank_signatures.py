@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bank_signatures import UNKNOWN_BANK, identify_bank_with_confidence, identify_statement, rank_banks, scan_signatures
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = set()
+
+    @property
+    def page_count(self):
+        return len(self.pages)
+
+    def page_text(self, index):
+        self.requested.add(index)
+        return self.pages[index]
+
+    def extract_text(self, max_pages=None):
+        count = len(self.pages) if max_pages is None else max_pages
+        return '\n'.join(self.page_text(i) for i in range(count))
+
+
+BANDHAN_PAGE = (
+    'Customer ID / CIF 304402364\n'
+    'IFSC BDBL0001822\n'
+    'Transaction Date Value Date Description Amount Dr / Cr Balance\n'
+)
+
+
+class TestBankSignatures(unittest.TestCase):
+    def test_labelled_ifsc_and_header_identify_bank(self):
+        bank, confidence = identify_bank_with_confidence(BANDHAN_PAGE)
+        self.assertEqual(bank, 'BANDHAN')
+        self.assertEqual(confidence, 1.0)
+
+    def test_ifsc_in_narration_is_ignored(self):
+        text = (
+            'Statement of Axis Bank Account No : 923020007685387\n'
+            'IFSC Code : UTIB0002121\n'
+            'NEFT/SBIN325094048635/Miss ABIDA ARIF/STATE BANK OF INDIA\n'
+        )
+        bank, confidence = identify_bank_with_confidence(text)
+        self.assertEqual(bank, 'AXIS')
+        self.assertGreater(confidence, 0.5)
+
+    def test_ranked_list_carries_evidence(self):
+        ranked = rank_banks(BANDHAN_PAGE + 'Paid to Axis Bank card\n')
+        self.assertEqual([item['bank'] for item in ranked], ['BANDHAN', 'AXIS'])
+        self.assertEqual(ranked[0]['evidence'], ['ifsc:BDBL', 'header:transactiondate+valuedate+dr/cr'])
+        self.assertEqual(ranked[1], {'bank': 'AXIS', 'score': 2, 'evidence': ['keyword:axisbank']})
+
+    def test_tokens_inside_longer_tokens_are_found(self):
+        tokens, _ = scan_signatures('S.No. Tran Date Particulars Dr/Cr')
+        self.assertTrue({'s.no.', 's.no', 'trandate', 'dr/cr'} <= tokens)
+
+    def test_unknown_text(self):
+        self.assertEqual(identify_bank_with_confidence('nothing here'), (UNKNOWN_BANK, 0.0))
+
+    def test_first_page_is_enough_when_confident(self):
+        session = FakeSession([BANDHAN_PAGE] + ['continuation'] * 56)
+        self.assertEqual(identify_statement(session), ('BANDHAN', 1.0, 1))
+        self.assertEqual(session.requested, {0})
+
+    def test_falls_back_to_more_pages(self):
+        session = FakeSession(['cover page', 'legend', BANDHAN_PAGE, 'more'])
+        bank, confidence, pages_scanned = identify_statement(session)
+        self.assertEqual(bank, 'BANDHAN')
+        self.assertEqual(pages_scanned, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from column_template import ColumnTemplate, header_score
+from transaction_stream import parse_statement
+from helpers import BANDHAN_PDF, bandhan_rows
+
+
+class TestColumnTemplate(unittest.TestCase):
+    def test_header_score(self):
+        self.assertEqual(header_score(['Date', 'Narration', 'Withdrawal Amt.', 'Closing Balance']), 4)
+        self.assertEqual(header_score(['Page 2', 'Account Branch', None]), 0)
+
+    def test_round_trip(self):
+        template = ColumnTemplate(['Txn Date', 'Particulars', 'Balance'], [30.0, 120.5, 400.0, 560.0], 'text')
+        restored = ColumnTemplate.from_dict(template.to_dict())
+        self.assertEqual(restored.to_dict(), template.to_dict())
+        self.assertEqual(restored.date_column, 0)
+        self.assertEqual(restored.table_settings['explicit_vertical_lines'], [30.0, 120.5, 400.0, 560.0])
+
+    def test_matches_requires_template_width_and_dates(self):
+        template = ColumnTemplate(['Date', 'Details', 'Balance'], [0, 10, 20, 30])
+        self.assertTrue(template.matches([['Date', 'Details', 'Balance'], ['01/02/2025', 'NEFT', '10.00']]))
+        self.assertFalse(template.matches([['01/02/2025', 'NEFT']]))
+        self.assertFalse(template.matches([['Opening', 'balance', '10.00']]))
+
+
+@unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+class TestTemplateParse(unittest.TestCase):
+    def test_template_parse_matches_default(self):
+        result = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, use_template=True)
+        self.assertEqual(result['total_transactions'], 158)
+        self.assertGreater(result['metadata']['template_pages'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
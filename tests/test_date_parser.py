@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from date_parser import clear_date_cache, parse_date, parse_dates
+
+
+class TestDateParser(unittest.TestCase):
+    def setUp(self):
+        clear_date_cache()
+
+    def test_bank_specific_formats(self):
+        cases = [
+            ('June30, 2025', 'BANDHAN', '2025-06-30'),
+            ('31-Mar-25\n(31-Mar-25)', 'IOB', '2025-03-31'),
+            ('2025-07-30', 'YES', '2025-07-30'),
+            ('01/04/2025', 'AXIS', '2025-04-01'),
+            ('30/03/2025 19:39:03', 'IDBI', '2025-03-30'),
+            ('03/04/25', 'HDFC', '2025-04-03'),
+            ('08-APR-2024', 'FEDERAL', '2024-04-08'),
+            ('1 Sep\n2025', 'SBI', '2025-09-01'),
+            ('1 Sep 2025', 'SBI', '2025-09-01'),
+            ('26Jun2025', 'HSBC', '2025-06-26'),
+        ]
+        for raw, bank, expected in cases:
+            with self.subTest(raw=raw, bank=bank):
+                self.assertEqual(parse_date(raw, bank), expected)
+
+    def test_day_first_without_bank(self):
+        self.assertEqual(parse_date('05-10-2024'), '2024-10-05')
+
+    def test_non_dates(self):
+        for raw in (None, '', 'Opening Balance', '100.00', '5', '31-02-2025', '1 Sep'):
+            with self.subTest(raw=raw):
+                self.assertIsNone(parse_date(raw, 'JK'))
+
+    def test_dateutil_fallback(self):
+        self.assertEqual(parse_date('30 June 2025', 'AXIS'), '2025-06-30')
+
+    def test_parse_dates_column(self):
+        column = ['30/06/25', '30/06/25', 'Opening Balance', '01/07/25']
+        self.assertEqual(parse_dates(column, 'HDFC'), ['2025-06-30', '2025-06-30', None, '2025-07-01'])
+
+
+if __name__ == '__main__':
+    unittest.main()
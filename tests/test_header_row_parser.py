@@ -0,0 +1,71 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from header_row_parser import HeaderRowParser, column_role
+from transaction_stream import StatementStream, parse_statement
+from helpers import BANDHAN_PDF
+
+
+class TestHeaderRowParser(unittest.TestCase):
+    def test_column_roles(self):
+        labels = ['Txn Date', 'Value Date', 'Narration', 'Withdrawal Amt.', 'Deposit Amt.', 'Dr/Cr', 'Closing Balance']
+        self.assertEqual([column_role(label) for label in labels],
+                         ['date', 'value_date', 'description', 'debit', 'credit', 'dr_cr', 'balance'])
+        self.assertIsNone(column_role('Chq No'))
+
+    def test_debit_and_credit_columns(self):
+        parser = HeaderRowParser()
+        transactions = parser([
+            ['Date', 'Particulars', 'Withdrawals', 'Deposits', 'Balance'],
+            ['01-04-2025', 'NEFT  SALARY', '', '50,000.00', '60,000.00'],
+            ['02-04-2025', 'ATM', '2,000.00', '', '58,000.00'],
+            ['Opening balance carried forward', '', '', '', ''],
+        ])
+        self.assertEqual(transactions, [
+            {'date': '2025-04-01', 'description': 'NEFT SALARY', 'debit': 0.0, 'credit': 50000.0, 'balance': 60000.0},
+            {'date': '2025-04-02', 'description': 'ATM', 'debit': 2000.0, 'credit': 0.0, 'balance': 58000.0},
+        ])
+
+    def test_header_carries_across_pages(self):
+        parser = HeaderRowParser()
+        parser([['Date', 'Description', 'Amount', 'Dr/Cr', 'Balance']])
+        transactions = parser([['03-04-2025', 'UPI', '150.00', 'DR', '57,850.00']])
+        self.assertEqual(transactions[0]['debit'], 150.0)
+        self.assertEqual(transactions[0]['balance'], 57850.0)
+
+    def test_signed_amount_column(self):
+        parser = HeaderRowParser()
+        transactions = parser([
+            ['Date', 'Description', 'Amount', 'Balance'],
+            ['04-04-2025', 'Refund', '300.00', '58,150.00'],
+            ['05-04-2025', 'Card', '-99.50', '58,050.50'],
+        ])
+        self.assertEqual([(tx['debit'], tx['credit']) for tx in transactions], [(0.0, 300.0), (99.5, 0.0)])
+
+    def test_rows_before_any_header_are_ignored(self):
+        self.assertEqual(HeaderRowParser()([['01-04-2025', 'NEFT', '', '10.00', '10.00']]), [])
+
+    @unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+    def test_reads_a_real_statement(self):
+        result = parse_statement(BANDHAN_PDF, row_parser=HeaderRowParser())
+        transactions = result['transactions']
+        self.assertEqual(len(transactions), 158)
+        self.assertEqual(transactions[0]['description'], 'GST')
+        self.assertTrue(all(tx['debit'] or tx['credit'] for tx in transactions))
+
+    @unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+    def test_stream_hands_over_the_identified_bank(self):
+        parser, named = HeaderRowParser(), HeaderRowParser('IDBI')
+        for row_parser in (parser, named):
+            stream = StatementStream(BANDHAN_PDF, row_parser=row_parser)
+            stream.identify()
+            stream.close()
+        self.assertEqual(parser.bank_name, 'BANDHAN')
+        self.assertEqual(named.bank_name, 'IDBI')
+
+
+if __name__ == '__main__':
+    unittest.main()
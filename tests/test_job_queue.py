@@ -0,0 +1,59 @@
+import os
+import sys
+import threading
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from job_queue import DONE, FAILED, JobQueue, QueueFull
+
+
+class TestJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = JobQueue(workers=1, max_pending=2, max_finished=2)
+
+    def tearDown(self):
+        self.queue.shutdown()
+
+    def test_result_and_progress(self):
+        def work(job):
+            job.set_progress(0, 3)
+            job.set_progress(2)
+            return {'transactions': []}
+
+        job = self.queue.wait(self.queue.submit(work).id, timeout=5)
+        self.assertEqual(job.status, DONE)
+        data = job.to_dict()
+        self.assertEqual(data['progress'], {'pages_done': 2, 'pages_total': 3})
+        self.assertEqual(data['result'], {'transactions': []})
+
+    def test_failure_is_reported(self):
+        def work(job):
+            raise ValueError('bad statement')
+
+        job = self.queue.wait(self.queue.submit(work).id, timeout=5)
+        self.assertEqual(job.status, FAILED)
+        self.assertEqual(job.to_dict()['error'], 'bad statement')
+
+    def test_backpressure(self):
+        release = threading.Event()
+        first = self.queue.submit(lambda job: release.wait(5))
+        self.queue.submit(lambda job: None)
+        with self.assertRaises(QueueFull):
+            self.queue.submit(lambda job: None)
+        release.set()
+        self.queue.wait(first.id, timeout=5)
+        self.queue.shutdown()
+        self.assertEqual(self.queue.pending, 0)
+
+    def test_only_recent_finished_jobs_are_kept(self):
+        jobs = [self.queue.submit(lambda job: None) for _ in range(2)]
+        for job in jobs:
+            self.queue.wait(job.id, timeout=5)
+        last = self.queue.wait(self.queue.submit(lambda job: None).id, timeout=5)
+        self.assertIsNone(self.queue.get(jobs[0].id))
+        self.assertIs(self.queue.get(last.id), last)
+
+
+if __name__ == '__main__':
+    unittest.main()
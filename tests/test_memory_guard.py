@@ -0,0 +1,61 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import memory_guard
+from memory_guard import MemoryGuard, MemoryLimitExceeded, current_rss_bytes
+from pdf_session import PdfSession
+from transaction_stream import parse_statement
+from helpers import BANDHAN_PDF, bandhan_rows
+
+
+class TestMemoryGuard(unittest.TestCase):
+    def test_records_peak(self):
+        guard = MemoryGuard()
+        guard.check()
+        self.assertGreater(guard.peak_mb, 0)
+        self.assertGreater(current_rss_bytes(), 0)
+
+    def test_ceiling_reclaims_before_raising(self):
+        reclaimed = []
+        with self.assertRaises(MemoryLimitExceeded):
+            MemoryGuard(max_rss_mb=1).check(reclaim=lambda: reclaimed.append(True))
+        self.assertEqual(reclaimed, [True])
+
+    def test_unknown_rss_is_not_enforced(self):
+        original = memory_guard.current_rss_bytes
+        memory_guard.current_rss_bytes = lambda: None
+        try:
+            guard = MemoryGuard(max_rss_mb=1)
+            guard.check()
+        finally:
+            memory_guard.current_rss_bytes = original
+        self.assertIsNone(guard.peak_mb)
+
+
+@unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+class TestLowMemoryParse(unittest.TestCase):
+    def test_low_memory_output_matches(self):
+        default = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows)
+        low = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, low_memory=True, max_rss_mb=4096)
+        self.assertEqual(low['transactions'], default['transactions'])
+        self.assertGreater(low['metadata']['peak_rss_mb'], 0)
+        self.assertEqual(low['metadata']['max_rss_mb'], 4096)
+        self.assertNotIn('peak_rss_mb', default['metadata'])
+
+    def test_discarded_page_cannot_be_read(self):
+        with PdfSession(BANDHAN_PDF) as session:
+            session.page_tables(0)
+            session.release_page(0, discard=True)
+            with self.assertRaises(ValueError):
+                session.page(0)
+
+    def test_ceiling_aborts_parse(self):
+        with self.assertRaises(MemoryLimitExceeded):
+            parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, max_rss_mb=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from page_cache import PageRowCache, page_fingerprint
+from pdf_session import PdfSession
+from transaction_stream import parse_statement
+from helpers import BANDHAN_PDF, bandhan_rows
+
+
+class TestPageRowCache(unittest.TestCase):
+    def test_lru_bound_and_copies(self):
+        cache = PageRowCache(max_pages=1)
+        cache.put('a', [['01-Apr-25', 'x']])
+        rows = cache.get('a')
+        rows[0][1] = 'changed'
+        self.assertEqual(cache.get('a'), [['01-Apr-25', 'x']])
+        cache.put('b', [])
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 1)
+
+
+@unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+class TestPageFingerprint(unittest.TestCase):
+    def test_fingerprint_is_stable_and_page_specific(self):
+        with PdfSession(BANDHAN_PDF) as first, PdfSession(BANDHAN_PDF) as second:
+            self.assertEqual(page_fingerprint(first.page(3)), page_fingerprint(second.page(3)))
+            self.assertNotEqual(page_fingerprint(first.page(3)), page_fingerprint(first.page(4)))
+            self.assertNotEqual(page_fingerprint(first.page(3)), page_fingerprint(first.page(3), extra='text'))
+
+    def test_second_parse_reuses_every_page(self):
+        cache = PageRowCache()
+        fresh = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, page_cache=cache)
+        reused = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, page_cache=cache)
+        self.assertEqual(fresh['metadata']['cached_pages'], 0)
+        # The two trailing pages hold no transactions and are skipped before the cache.
+        self.assertEqual(reused['metadata']['cached_pages'], 12)
+        self.assertEqual(reused['metadata']['skipped_pages'], [12, 13])
+        self.assertEqual(reused['transactions'], fresh['transactions'])
+
+    def test_key_includes_bank_and_extraction_path(self):
+        cache = PageRowCache()
+        parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, page_cache=cache)
+        other_bank = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, page_cache=cache, bank_name='IOB')
+        self.assertEqual(other_bank['metadata']['cached_pages'], 0)
+        template = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, page_cache=cache, use_template=True)
+        self.assertEqual(template['metadata']['cached_pages'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+import pdfplumber
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import transaction_stream
+from page_probe import may_hold_transactions
+from transaction_stream import parse_statement
+from helpers import BANDHAN_PDF, KOTAK_PDF, bandhan_rows
+
+
+@unittest.skipUnless(os.path.exists(KOTAK_PDF), 'sample PDF not available')
+class TestPageProbe(unittest.TestCase):
+    def test_legend_and_certificate_pages_are_skipped(self):
+        with pdfplumber.open(KOTAK_PDF) as pdf:
+            verdicts = [may_hold_transactions(page) for page in pdf.pages]
+        # Statement, code legend, balance certificate, interest certificate, end page.
+        self.assertEqual(verdicts[:5], [True, False, True, False, False])
+
+
+@unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+class TestSkippedPages(unittest.TestCase):
+    def test_skipping_keeps_every_transaction(self):
+        result = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows)
+        self.assertEqual(result['total_transactions'], 158)
+        self.assertEqual(result['metadata']['skipped_pages'], [12, 13])
+        self.assertGreaterEqual(result['metadata']['estimated_seconds_saved'], 0)
+        self.assertNotIn('skipped_pages', parse_statement(BANDHAN_PDF, row_parser=bandhan_rows,
+                                                          skip_pages=False)['metadata'])
+
+    def test_page_continuing_a_transaction_is_never_skipped(self):
+        # Stand-in for a page of nothing but narration: the probe rejects
+        # page 2, but page 1 ends with a transaction it may continue.
+        original = transaction_stream.may_hold_transactions
+        transaction_stream.may_hold_transactions = lambda page: page.page_number != 2 and original(page)
+        try:
+            result = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows)
+        finally:
+            transaction_stream.may_hold_transactions = original
+        self.assertEqual(result['total_transactions'], 158)
+        self.assertEqual(result['metadata']['skipped_pages'], [12, 13])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parallel_extract import extract_page_tables, split_page_ranges, stitch_pages
+from helpers import BANDHAN_PDF
+
+
+class TestParallelExtract(unittest.TestCase):
+    def test_split_page_ranges_covers_every_page_in_order(self):
+        ranges = split_page_ranges(57, 4)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], 57)
+        for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(stop, start)
+        self.assertEqual(split_page_ranges(0, 4), [])
+
+    def test_stitch_merges_rows_across_page_boundary(self):
+        pages = [
+            [['01-Apr-25', 'UPI/1234/DR/', '100.00'], ['02-Apr-25', 'NEFT-YESB-', '']],
+            [['', 'PHONEPE PR', '250.00'], ['03-Apr-25', 'GST', '2.30']],
+        ]
+        rows = stitch_pages(pages)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1], ['02-Apr-25', 'NEFT-YESB-\nPHONEPE PR', '250.00'])
+        self.assertEqual(rows[2][0], '03-Apr-25')
+
+    def test_stitch_looks_past_repeated_header(self):
+        header = ['Transaction Date', 'Value Date', 'Description']
+        pages = [
+            [header, ['June30, 2025', 'June30, 2025', 'UPI/CR/']],
+            [header, ['', '', 'ybl/Payment fr/'], ['June29, 2025', 'June29, 2025', 'GST']],
+        ]
+        rows = stitch_pages(pages)
+        self.assertEqual(rows[1][2], 'UPI/CR/\nybl/Payment fr/')
+        self.assertEqual(rows[2], header)
+        self.assertEqual(len(rows), 4)
+
+    def test_leading_continuation_on_first_page_is_kept(self):
+        rows = stitch_pages([[['', 'orphan']], [['01-Apr-25', 'x']]])
+        self.assertEqual(rows, [['', 'orphan'], ['01-Apr-25', 'x']])
+
+    @unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+    def test_parallel_matches_sequential(self):
+        sequential = extract_page_tables(BANDHAN_PDF, workers=1)
+        parallel = extract_page_tables(BANDHAN_PDF, workers=2)
+        self.assertEqual(len(parallel), 14)
+        self.assertEqual(parallel, sequential)
+
+
+if __name__ == '__main__':
+    unittest.main()
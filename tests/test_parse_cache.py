@@ -0,0 +1,79 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parse_cache import ParseCache, make_cache_key
+
+
+def sample_result(n):
+    return {'bank_name': 'IOB', 'total_transactions': n, 'transactions': [], 'metadata': {}}
+
+
+class TestParseCache(unittest.TestCase):
+    def test_key_depends_on_bytes_parser_and_password(self):
+        key = make_cache_key(b'%PDF-1', 'IOB', 'secret')
+        self.assertEqual(key, make_cache_key(b'%PDF-1', 'IOB', 'secret'))
+        self.assertNotEqual(key, make_cache_key(b'%PDF-2', 'IOB', 'secret'))
+        self.assertNotEqual(key, make_cache_key(b'%PDF-1', 'HDFC', 'secret'))
+        self.assertNotEqual(key, make_cache_key(b'%PDF-1', 'IOB', None))
+        self.assertNotIn('secret', key)
+
+    def test_file_object_is_keyed_by_its_contents(self):
+        upload = io.BytesIO(b'%PDF-1')
+        upload.seek(3)
+        self.assertEqual(make_cache_key(upload, 'IOB', 'secret'), make_cache_key(b'%PDF-1', 'IOB', 'secret'))
+        self.assertEqual(upload.tell(), 3)
+
+    def test_get_or_parse_reports_hit_and_miss(self):
+        cache = ParseCache()
+        calls = []
+
+        def parse():
+            calls.append(1)
+            return sample_result(3)
+
+        first = cache.get_or_parse('k', parse)
+        second = cache.get_or_parse('k', parse)
+        self.assertEqual(first['metadata']['cache'], 'miss')
+        self.assertEqual(second['metadata']['cache'], 'hit')
+        self.assertEqual(len(calls), 1)
+
+    def test_memory_tier_is_lru_bounded(self):
+        cache = ParseCache(max_entries=2)
+        cache.put('a', sample_result(1))
+        cache.put('b', sample_result(2))
+        cache.get('a')
+        cache.put('c', sample_result(3))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+    def test_derived_values_are_evicted_with_their_result(self):
+        cache = ParseCache(max_entries=1)
+        builds = []
+        cache.put('a', sample_result(1))
+        self.assertEqual(cache.derived('a', lambda: builds.append('a') or 'batch a'), 'batch a')
+        self.assertEqual(cache.derived('a', lambda: builds.append('a') or 'batch a'), 'batch a')
+        self.assertEqual(builds, ['a'])
+        cache.put('b', sample_result(2))
+        self.assertNotIn('a', cache._derived)
+        self.assertEqual(cache.derived('gone', lambda: 'built'), 'built')
+        self.assertNotIn('gone', cache._derived)
+
+    def test_disk_tier_survives_memory_eviction_and_is_size_bounded(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ParseCache(max_entries=1, cache_dir=cache_dir)
+            cache.put('a', sample_result(1))
+            cache.put('b', sample_result(2))
+            self.assertEqual(cache.get('a')['total_transactions'], 1)
+
+            small = ParseCache(max_entries=1, cache_dir=cache_dir, max_disk_bytes=1)
+            small.put('c', sample_result(3))
+            self.assertLessEqual(len(os.listdir(cache_dir)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
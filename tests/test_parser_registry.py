@@ -0,0 +1,107 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import parser_registry
+from bank_signatures import BANK_SIGNATURES
+from header_row_parser import HeaderRowParser
+from parser_registry import get_row_parser, loaded_row_parsers, register_row_parser, row_parser_path
+from transaction_stream import parse_statement
+from helpers import AXIS_PDF, BANDHAN_PDF, CBI_PDF, IDBI_2_PDF, KOTAK_PDF, YES_PDF, balance_breaks
+
+FAKE_PARSER = '''
+class FakeRowParser:
+    def __init__(self, bank_name=None):
+        self.bank_name = bank_name
+
+    def __call__(self, rows):
+        return []
+'''
+
+
+class TestParserRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.tmp.name, 'registry_fake_parser.py'), 'w') as f:
+            f.write(FAKE_PARSER)
+        sys.path.insert(0, self.tmp.name)
+        self.saved = dict(parser_registry.ROW_PARSERS)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        sys.modules.pop('registry_fake_parser', None)
+        parser_registry.ROW_PARSERS.clear()
+        parser_registry.ROW_PARSERS.update(self.saved)
+        parser_registry._classes.pop('registry_fake_parser:FakeRowParser', None)
+        self.tmp.cleanup()
+
+    def test_every_identified_bank_has_a_row_parser(self):
+        self.assertEqual(set(parser_registry.ROW_PARSERS), set(BANK_SIGNATURES))
+        self.assertEqual(row_parser_path('UNKNOWN'), parser_registry.DEFAULT_ROW_PARSER)
+
+    def test_module_is_imported_on_first_use_only(self):
+        register_row_parser('FAKE', 'registry_fake_parser:FakeRowParser')
+        self.assertNotIn('registry_fake_parser', sys.modules)
+        self.assertNotIn('registry_fake_parser:FakeRowParser', loaded_row_parsers())
+        parser = get_row_parser('FAKE')
+        self.assertIn('registry_fake_parser', sys.modules)
+        self.assertIn('registry_fake_parser:FakeRowParser', loaded_row_parsers())
+        self.assertEqual(parser.bank_name, 'FAKE')
+
+    def test_each_statement_gets_its_own_parser(self):
+        first, second = get_row_parser('CANARA'), get_row_parser('CANARA')
+        self.assertIsInstance(first, HeaderRowParser)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.bank_name, 'CANARA')
+
+
+class TestRegistryParsesSamples(unittest.TestCase):
+    """Statements parsed with no row parser given, through the registry."""
+
+    def check(self, path, bank, count):
+        if not os.path.exists(path):
+            self.skipTest('sample PDF not available')
+        result = parse_statement(path)
+        transactions = result['transactions']
+        self.assertEqual(result['bank_name'], bank)
+        self.assertEqual(len(transactions), count)
+        self.assertTrue(all(tx['balance'] for tx in transactions))
+        return transactions
+
+    def test_bandhan(self):
+        transactions = self.check(BANDHAN_PDF, 'BANDHAN', 158)
+        self.assertEqual(balance_breaks(transactions), [])
+        self.assertEqual(transactions[0]['balance'], 34279.01)
+
+    def test_axis(self):
+        transactions = self.check(AXIS_PDF, 'AXIS', 24)
+        self.assertEqual(balance_breaks(transactions), [])
+        self.assertEqual(transactions[0]['balance'], 400285.96)
+
+    def test_cbi(self):
+        transactions = self.check(CBI_PDF, 'CBI', 55)
+        self.assertEqual(balance_breaks(transactions), [])
+        self.assertEqual(transactions[-1]['balance'], 3392.5)
+
+    def test_idbi(self):
+        transactions = self.check(IDBI_2_PDF, 'IDBI', 530)
+        self.assertEqual(balance_breaks(transactions), [])
+        self.assertEqual(transactions[0]['balance'], 223272.2)
+
+    def test_kotak(self):
+        transactions = self.check(KOTAK_PDF, 'KOTAK', 19)
+        self.assertEqual(balance_breaks(transactions), [])
+        self.assertEqual(transactions[-1]['balance'], 22182.66)
+
+    def test_yes_word_layout(self):
+        transactions = self.check(YES_PDF, 'YES', 46)
+        # Two same-day charges are printed after the balance they produced.
+        self.assertEqual(balance_breaks(transactions), [2, 3])
+        self.assertEqual(transactions[-1]['balance'], 10824.84)
+
+
+if __name__ == '__main__':
+    unittest.main()
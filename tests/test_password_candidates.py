@@ -0,0 +1,90 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import password_candidates as password_candidates_module
+from password_candidates import encryption_handler, find_password, guess_password, password_candidates
+from helpers import BANDHAN_PDF, IDBI_PDF, JK_PDF
+
+
+class SlowHandler:
+    """Stands in for an AES-256 security handler; picklable for the pool."""
+    r = 6
+
+    def authenticate(self, candidate):
+        return b'key' if candidate == 'p0200' else None
+
+
+class TestPasswordCandidates(unittest.TestCase):
+    def test_filename_digits_come_first(self):
+        candidates = password_candidates('IDBI_99128926.PDF')
+        self.assertEqual(candidates[:2], ['', '99128926'])
+        self.assertIn('8926', candidates)
+
+    def test_hints(self):
+        candidates = password_candidates(hints=['Amit Paik', '01/02/1990', '+91 98765 43210', '51087192'])
+        for expected in ('9876543210', '51087192', '7192', '01021990', 'AMIT0102', 'amit0102', '43210010290'):
+            self.assertIn(expected, candidates)
+        self.assertEqual(len(candidates), len(set(candidates)))
+
+
+class TestFindPassword(unittest.TestCase):
+    @unittest.skipUnless(os.path.exists(IDBI_PDF), 'sample PDF not available')
+    def test_filename_password(self):
+        self.assertEqual(guess_password(IDBI_PDF, 'IDBI_99128926.PDF'), '99128926')
+
+    @unittest.skipUnless(os.path.exists(JK_PDF), 'sample PDF not available')
+    def test_mobile_hint_from_bytes(self):
+        with open(JK_PDF, 'rb') as f:
+            data = f.read()
+        self.assertIsNotNone(encryption_handler(data))
+        self.assertIsNone(find_password(data, password_candidates('JK_BANK.pdf')))
+        self.assertEqual(guess_password(data, 'JK_BANK.pdf', hints=['8420641706']), '8420641706')
+
+    @unittest.skipUnless(os.path.exists(IDBI_PDF), 'sample PDF not available')
+    def test_file_object_is_rewound(self):
+        with open(IDBI_PDF, 'rb') as f:
+            self.assertEqual(guess_password(f, 'IDBI_99128926.PDF'), '99128926')
+            self.assertEqual(f.tell(), 0)
+
+    @unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+    def test_unencrypted(self):
+        self.assertIsNone(encryption_handler(BANDHAN_PDF))
+        self.assertIsNone(guess_password(BANDHAN_PDF, 'Bandhan_bank.pdf'))
+
+    @unittest.skipUnless(os.path.exists(IDBI_PDF) and os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+    def test_falls_back_when_pdfminer_internals_change(self):
+        def changed(source):
+            raise AttributeError("'PDFDocument' object has no attribute 'encryption'")
+
+        original = password_candidates_module.encryption_handler
+        password_candidates_module.encryption_handler = changed
+        try:
+            with open(IDBI_PDF, 'rb') as f:
+                self.assertEqual(find_password(f, password_candidates('IDBI_99128926.PDF')), '99128926')
+            self.assertEqual(find_password(BANDHAN_PDF, ['secret']), '')
+            self.assertIsNone(find_password(IDBI_PDF, ['secret']))
+        finally:
+            password_candidates_module.encryption_handler = original
+
+    def test_large_search_uses_the_shared_spawned_pool(self):
+        original = password_candidates_module.encryption_handler
+        password_candidates_module.encryption_handler = lambda source: SlowHandler()
+        try:
+            candidates = [f'p{i:04d}' for i in range(300)]
+            self.assertEqual(find_password(b'', candidates, workers=2), 'p0200')
+            pool = password_candidates_module._pool
+            self.assertIsNone(find_password(b'', ['nope'] * 100, workers=2))
+        finally:
+            password_candidates_module.encryption_handler = original
+        self.assertIs(password_candidates_module._pool, pool)
+        self.assertEqual(pool._mp_context.get_start_method(), 'spawn')
+
+    def test_unreadable_upload(self):
+        self.assertIsNone(guess_password(b'%PDF-1.4 sample', 'statement.pdf'))
+
+
+if __name__ == '__main__':
+    unittest.main()
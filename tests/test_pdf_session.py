@@ -0,0 +1,73 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pdf_session import PdfSession
+from helpers import BANDHAN_PDF, IOB_PDF
+
+
+@unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+class TestPdfSession(unittest.TestCase):
+    def test_page_results_are_memoized(self):
+        with PdfSession(BANDHAN_PDF) as session:
+            self.assertEqual(session.page_count, 14)
+            self.assertIs(session.page_text(0), session.page_text(0))
+            self.assertIs(session.page_tables(0), session.page_tables(0))
+            self.assertIs(session.page_words(0), session.page_words(0))
+
+    def test_extract_text_limits_pages(self):
+        with PdfSession(BANDHAN_PDF) as session:
+            first = session.extract_text(max_pages=1)
+            self.assertIn('BDBL', first)
+            self.assertEqual(first, session.page_text(0))
+
+    def test_ensure_reuses_existing_session(self):
+        with PdfSession(BANDHAN_PDF) as session:
+            same, owned = PdfSession.ensure(session)
+            self.assertIs(same, session)
+            self.assertFalse(owned)
+        fresh, owned = PdfSession.ensure(BANDHAN_PDF)
+        self.assertTrue(owned)
+        fresh.close()
+
+    @unittest.skipUnless(os.path.exists(IOB_PDF), 'sample PDF not available')
+    def test_password_protected_pdf(self):
+        with PdfSession(IOB_PDF, password='51087192') as session:
+            self.assertIn('IOBA', session.page_text(0))
+
+    @unittest.skipUnless(os.path.exists(IOB_PDF), 'sample PDF not available')
+    def test_in_memory_statement_is_wiped_on_close(self):
+        with open(IOB_PDF, 'rb') as f:
+            data = f.read()
+        session = PdfSession(data, password='51087192')
+        self.assertIn('IOBA', session.page_text(0))
+        buffer = session.pdf.stream
+        stream = session.page(0).page_obj.contents[0]
+        self.assertEqual(buffer.getvalue(), data)
+        session.close()
+        self.assertTrue(buffer.closed)
+        self.assertIsNone(stream.data)
+        self.assertIsNone(stream.rawdata)
+
+    def test_close_survives_changed_pdfminer_internals(self):
+        session = PdfSession(BANDHAN_PDF)
+        self.assertTrue(session.page_text(0))
+        del session.pdf.doc._parsed_objs
+        session.close()
+        self.assertIsNone(session._pdf)
+
+    @unittest.skipUnless(os.path.exists(IOB_PDF), 'sample PDF not available')
+    def test_spooled_upload(self):
+        with open(IOB_PDF, 'rb') as f, tempfile.SpooledTemporaryFile(max_size=1 << 20) as upload:
+            upload.write(f.read())
+            upload.seek(0)
+            with PdfSession(upload, password='51087192') as session:
+                self.assertIn('IOBA', session.page_text(0))
+                self.assertIsNone(session._buffer)
+
+
+if __name__ == '__main__':
+    unittest.main()
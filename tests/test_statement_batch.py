@@ -0,0 +1,80 @@
+import io
+import os
+import sys
+import unittest
+import zipfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import statement_batch
+from statement_batch import BatchError, batch_entries, parse_batch
+
+
+def fake_parse(data, password):
+    if data.startswith(b'bad'):
+        raise ValueError('not a statement')
+    return {'size': len(data), 'password': password}
+
+
+def zipped(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestBatchEntries(unittest.TestCase):
+    def test_zip_members_are_expanded(self):
+        archive = zipped({'2024/apr.pdf': b'%PDF apr', 'notes.txt': b'x', '__MACOSX/._apr.pdf': b'x'})
+        entries = batch_entries([('may.pdf', b'%PDF may'), ('year.zip', archive)])
+        self.assertEqual(entries, [('may.pdf', b'%PDF may'), ('2024/apr.pdf', b'%PDF apr')])
+
+    def test_members_with_the_same_name_stay_apart(self):
+        archive = zipped({'2024/apr.pdf': b'%PDF 2024', '2025/apr.pdf': b'%PDF 2025'})
+        self.assertEqual(batch_entries([('years.zip', archive)]),
+                         [('2024/apr.pdf', b'%PDF 2024'), ('2025/apr.pdf', b'%PDF 2025')])
+
+    def test_limits(self):
+        with self.assertRaises(BatchError):
+            batch_entries([('a.pdf', b'1'), ('b.pdf', b'2')], max_files=1)
+        with self.assertRaises(BatchError):
+            batch_entries([('year.zip', zipped({'a.pdf': b'12345'}))], max_file_bytes=4)
+        with self.assertRaises(BatchError):
+            batch_entries([('year.zip', b'not a zip')])
+
+    def test_total_unpacked_size_is_capped(self):
+        archive = zipped({'a.pdf': b'1234', 'b.pdf': b'5678'})
+        self.assertEqual(len(batch_entries([('year.zip', archive)], max_batch_bytes=8)), 2)
+        with self.assertRaises(BatchError):
+            batch_entries([('year.zip', archive)], max_batch_bytes=7)
+        with self.assertRaises(BatchError):
+            batch_entries([('c.pdf', b'12'), ('year.zip', archive)], max_batch_bytes=9)
+
+
+class TestParseBatch(unittest.TestCase):
+    jobs = [('a.pdf', b'%PDF a', 'secret'), ('b.pdf', b'bad', None), ('c.pdf', b'%PDF cc', None)]
+
+    def check(self, results):
+        self.assertEqual([entry['file'] for entry in results], ['a.pdf', 'b.pdf', 'c.pdf'])
+        self.assertEqual([entry['status'] for entry in results], ['ok', 'error', 'ok'])
+        self.assertEqual(results[0]['result'], {'size': 6, 'password': 'secret'})
+        self.assertEqual(results[1]['error'], 'not a statement')
+        self.assertTrue(all(entry['seconds'] >= 0 for entry in results))
+
+    def test_failure_is_isolated(self):
+        self.check(parse_batch(self.jobs, fake_parse))
+
+    def test_process_pool(self):
+        self.check(parse_batch(self.jobs, fake_parse, workers=2))
+
+    def test_process_pool_is_shared_and_spawned(self):
+        parse_batch(self.jobs, fake_parse, workers=2)
+        pool = statement_batch._pool
+        self.check(parse_batch(self.jobs, fake_parse, workers=2))
+        self.assertIs(statement_batch._pool, pool)
+        self.assertEqual(pool._mp_context.get_start_method(), 'spawn')
+
+
+if __name__ == '__main__':
+    unittest.main()
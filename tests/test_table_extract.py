@@ -0,0 +1,49 @@
+import os
+import sys
+import unittest
+
+import pdfplumber
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from table_extract import extract_tables
+
+SAMPLES = [
+    os.path.join(os.path.dirname(__file__), '..', name)
+    for name in ('Indian_Bank.pdf', 'Union_Bank.PDF', 'Axis_Bank.PDF')
+]
+
+
+class TestExtractTables(unittest.TestCase):
+    def test_matches_pdfplumber(self):
+        for path in SAMPLES:
+            if not os.path.exists(path):
+                continue
+            with pdfplumber.open(path) as pdf:
+                for page in pdf.pages[:3]:
+                    with self.subTest(path=os.path.basename(path), page=page.page_number):
+                        self.assertEqual(extract_tables(page), page.extract_tables())
+
+    def test_explicit_settings(self):
+        path = SAMPLES[0]
+        if not os.path.exists(path):
+            self.skipTest('sample PDF not available')
+        settings = {'vertical_strategy': 'text', 'horizontal_strategy': 'text'}
+        with pdfplumber.open(path) as pdf:
+            page = pdf.pages[0]
+            self.assertEqual(extract_tables(page, settings), page.extract_tables(settings))
+
+    def test_text_settings_are_passed_on(self):
+        path = SAMPLES[1]
+        if not os.path.exists(path):
+            self.skipTest('sample PDF not available')
+        settings = {'text_x_tolerance': 0.5, 'text_y_tolerance': 8}
+        with pdfplumber.open(path) as pdf:
+            page = pdf.pages[0]
+            tuned = extract_tables(page, settings)
+            self.assertEqual(tuned, page.extract_tables(settings))
+            self.assertNotEqual(tuned, extract_tables(page))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import transaction_stream
+from column_template import ColumnTemplate
+from template_store import TemplateStore, header_fingerprint
+from transaction_stream import parse_statement
+from helpers import BANDHAN_PDF, bandhan_rows
+
+
+class TestTemplateStore(unittest.TestCase):
+    def test_fingerprint_ignores_label_noise_and_small_shifts(self):
+        a = ColumnTemplate(['Txn Date', 'Withdrawal\nAmt.'], [30.0, 200.0, 400.0])
+        b = ColumnTemplate(['TXN DATE', 'Withdrawal Amt'], [30.4, 200.3, 400.2])
+        c = ColumnTemplate(['Txn Date', 'Balance'], [30.0, 200.0, 400.0])
+        self.assertEqual(header_fingerprint(a, 600), header_fingerprint(b, 600))
+        self.assertNotEqual(header_fingerprint(a, 600), header_fingerprint(c, 600))
+
+    def test_entries_persist(self):
+        template = ColumnTemplate(['Date', 'Details', 'Balance'], [10.0, 80.0, 300.0, 500.0])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'templates.json')
+            TemplateStore(path).add('abc', 'IOB', template, parser='iob')
+            entry = TemplateStore(path).lookup('abc')
+        self.assertEqual(entry['bank'], 'IOB')
+        self.assertEqual(entry['parser'], 'iob')
+        self.assertEqual(entry['template'].to_dict(), template.to_dict())
+        self.assertIsNone(TemplateStore().lookup('abc'))
+
+
+@unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+class TestStoreParse(unittest.TestCase):
+    def test_known_layout_skips_identification(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'templates.json')
+            first = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, template_store=TemplateStore(path),
+                                    parser_id='bandhan')
+            second = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, template_store=TemplateStore(path))
+        self.assertFalse(first['metadata']['template_match'])
+        self.assertTrue(second['metadata']['template_match'])
+        self.assertEqual(second['bank_name'], 'BANDHAN')
+        self.assertEqual(second['metadata']['parser'], 'bandhan')
+        self.assertEqual(second['metadata']['identification_confidence'], 1.0)
+        self.assertEqual(second['total_transactions'], 158)
+
+    def test_unsure_identification_is_not_stored(self):
+        original = transaction_stream.identify_statement
+        transaction_stream.identify_statement = lambda session: ('BANDHAN', 0.1, 1)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                store = TemplateStore(os.path.join(tmp, 'templates.json'))
+                guessed = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, template_store=store)
+                self.assertEqual(guessed['total_transactions'], 158)
+                self.assertEqual(len(store), 0)
+                parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, bank_name='BANDHAN', template_store=store)
+                self.assertEqual(len(store), 1)
+        finally:
+            transaction_stream.identify_statement = original
+
+
+if __name__ == '__main__':
+    unittest.main()
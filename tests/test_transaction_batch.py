@@ -0,0 +1,128 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from money import paise_to_rupees, rupees_to_paise
+from transaction_batch import TransactionBatch
+
+
+class Transaction:
+    def __init__(self, date, description, debit, credit, balance):
+        self.date = date
+        self.description = description
+        self.debit = debit
+        self.credit = credit
+        self.balance = balance
+
+
+ROWS = [
+    Transaction('2025-06-30', 'GST', 2.30, 0.0, 34279.01),
+    Transaction('2025-06-30', 'IMPS Outward Payment - CA\n101', 12.70, 0.0, 34281.31),
+    Transaction('2025-06-29', 'NEFT Cr-ICIC0SF0002', 0.0, 40000.0, 34294.01),
+]
+
+
+class TestTransactionBatch(unittest.TestCase):
+    def test_round_trips_to_dicts(self):
+        batch = TransactionBatch.from_transactions(ROWS)
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.dates, ['2025-06-30', '2025-06-29'])
+        self.assertEqual(batch.to_dicts()[1], {
+            'date': '2025-06-30',
+            'description': 'IMPS Outward Payment - CA\n101',
+            'debit': 12.70,
+            'credit': 0.0,
+            'balance': 34281.31,
+        })
+
+    def test_accepts_dicts_and_missing_amounts(self):
+        batch = TransactionBatch()
+        batch.append_transaction({'date': '2025-04-01', 'description': None, 'debit': None, 'credit': 5.0})
+        self.assertEqual(batch.row(0), {'date': '2025-04-01', 'description': '', 'debit': 0.0, 'credit': 5.0, 'balance': 0.0})
+        self.assertEqual(batch.credit[0], 500)
+
+    def test_extend_appends_other_batch(self):
+        first = TransactionBatch.from_transactions(ROWS[:1])
+        first.extend(TransactionBatch.from_transactions(ROWS[1:]))
+        self.assertEqual([row['description'] for row in first][2], 'NEFT Cr-ICIC0SF0002')
+
+    def test_dataframe_views_amount_buffers(self):
+        batch = TransactionBatch.from_transactions(ROWS)
+        frame = batch.to_dataframe()
+        self.assertEqual(list(frame.columns), list(TransactionBatch.FIELDS))
+        self.assertAlmostEqual(frame['credit'].sum(), 40000.0)
+        self.assertEqual(list(frame['date'].astype(str)), ['2025-06-30', '2025-06-30', '2025-06-29'])
+        paise = batch.to_dataframe(paise=True)
+        self.assertEqual(paise['balance'].dtype.name, 'int64')
+        self.assertEqual(int(paise['balance'].iloc[0]), 3427901)
+
+    def test_dataframe_with_undated_row(self):
+        batch = TransactionBatch.from_transactions([ROWS[0], {'date': None, 'description': 'Opening balance'}, ROWS[2]])
+        frame = batch.to_dataframe()
+        self.assertEqual(list(frame['date'].isna()), [False, True, False])
+        self.assertEqual(list(frame['date'].astype(str)[[0, 2]]), ['2025-06-30', '2025-06-29'])
+        self.assertEqual(batch.row(1)['date'], None)
+
+    def test_empty_dataframe(self):
+        self.assertEqual(len(TransactionBatch().to_dataframe()), 0)
+
+    def test_totals_are_exact(self):
+        batch = TransactionBatch()
+        for _ in range(10):
+            batch.append_transaction({'date': '2025-04-01', 'description': 'x', 'debit': 0.1})
+        batch.append_transaction({'date': '2025-04-02', 'description': 'y', 'credit': 0.3})
+        self.assertEqual(batch.totals(), {'total_debit': 100, 'total_credit': 30, 'net_change': -70})
+        self.assertEqual(batch.summary()['total_debit'], 1.0)
+
+    def test_running_balance_newest_first(self):
+        batch = TransactionBatch.from_transactions(ROWS)
+        self.assertEqual(batch.check_running_balance(), {'order': 'descending', 'mismatches': []})
+
+    def test_running_balance_reports_bad_rows(self):
+        batch = TransactionBatch()
+        batch.append('2025-04-01', 'opening', 0, 0, 10000)
+        batch.append('2025-04-02', 'debit', 2500, 0, 7500)
+        batch.append('2025-04-03', 'credit', 0, 1000, 9000)
+        self.assertEqual(batch.check_running_balance(), {'order': 'ascending', 'mismatches': [2]})
+
+    def test_select_filters_and_sorts(self):
+        batch = TransactionBatch.from_transactions(ROWS + [Transaction('01/07/2025', 'gst reversal', 0.0, 2.30, 34281.31)])
+        self.assertEqual(batch.select().tolist(), [0, 1, 2, 3])
+        self.assertEqual(batch.select(query='GST').tolist(), [0, 3])
+        self.assertEqual(batch.select(kind='credit').tolist(), [2, 3])
+        self.assertEqual(batch.select(date_from='2025-06-30').tolist(), [0, 1, 3])
+        # Mixed date formats sort by calendar date; ties keep statement order.
+        self.assertEqual(batch.select(sort='date').tolist(), [2, 0, 1, 3])
+        self.assertEqual(batch.select(sort='date', descending=True).tolist(), [3, 0, 1, 2])
+        self.assertEqual(batch.select(sort='balance', descending=True).tolist(), [2, 1, 3, 0])
+        self.assertEqual(batch.select(kind='debit', sort='description').tolist(), [0, 1])
+
+    def test_columns(self):
+        batch = TransactionBatch.from_transactions(ROWS)
+        self.assertEqual(batch.columns([2, 0]), {
+            'date': ['2025-06-29', '2025-06-30'],
+            'description': ['NEFT Cr-ICIC0SF0002', 'GST'],
+            'debit': [0.0, 2.30],
+            'credit': [40000.0, 0.0],
+            'balance': [34294.01, 34279.01],
+        })
+        self.assertEqual(TransactionBatch().columns()['date'], [])
+
+
+class TestMoney(unittest.TestCase):
+    def test_rupees_to_paise(self):
+        self.assertEqual(rupees_to_paise(34279.01), 3427901)
+        self.assertEqual(rupees_to_paise('1,00,102.03'), 10010203)
+        self.assertEqual(rupees_to_paise(None), 0)
+        self.assertEqual(rupees_to_paise(12), 1200)
+        with self.assertRaises(ValueError):
+            rupees_to_paise('Transfer')
+
+    def test_paise_to_rupees(self):
+        self.assertEqual(paise_to_rupees(3427901), 34279.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from transaction_stream import StatementStream, iter_transactions, ndjson_lines, parse_statement
+from helpers import BANDHAN_PDF, bandhan_rows
+
+
+@unittest.skipUnless(os.path.exists(BANDHAN_PDF), 'sample PDF not available')
+class TestTransactionStream(unittest.TestCase):
+    def test_parse_statement_collects_stream(self):
+        result = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows)
+        self.assertEqual(result['bank_name'], 'BANDHAN')
+        self.assertEqual(result['total_transactions'], 158)
+        self.assertEqual(result['metadata']['account_number'], '10190010058888')
+
+    def test_iter_transactions_is_lazy(self):
+        stream = StatementStream(BANDHAN_PDF, row_parser=bandhan_rows)
+        iterator = iter(stream)
+        first = next(iterator)
+        self.assertEqual(first['description'], 'GST')
+        self.assertLess(stream.pages_done, stream.page_count)
+        iterator.close()
+
+    def test_no_continuation_row_reaches_parser(self):
+        seen = []
+        for row in iter_transactions(BANDHAN_PDF, row_parser=lambda rows: rows):
+            seen.append(row)
+        self.assertFalse([row for row in seen if not (row[0] or '').strip()])
+
+    def test_ndjson_lines(self):
+        stream = StatementStream(BANDHAN_PDF, row_parser=bandhan_rows)
+        lines = ndjson_lines(stream)
+        metadata = json.loads(next(lines))
+        self.assertEqual(metadata['type'], 'metadata')
+        self.assertEqual(metadata['bank_name'], 'BANDHAN')
+        self.assertEqual(metadata['metadata']['account_number'], '10190010058888')
+        self.assertEqual(stream.pages_done, 0)
+        records = [json.loads(line) for line in lines]
+        self.assertEqual([record['type'] for record in records[:-1]], ['transaction'] * 158)
+        self.assertEqual(records[0]['transaction']['description'], 'GST')
+        self.assertEqual(records[-1]['type'], 'summary')
+        self.assertEqual(records[-1]['total_transactions'], 158)
+
+    def test_ndjson_error_line(self):
+        def failing_rows(rows):
+            raise ValueError('unreadable row')
+            yield
+
+        records = [json.loads(line) for line in ndjson_lines(StatementStream(BANDHAN_PDF, row_parser=failing_rows))]
+        self.assertEqual([record['type'] for record in records], ['metadata', 'error'])
+        self.assertEqual(records[-1]['error'], 'unreadable row')
+
+    def test_parallel_workers_match_serial(self):
+        serial = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows)
+        parallel = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, workers=2)
+        self.assertEqual(parallel['transactions'], serial['transactions'])
+        self.assertEqual(parallel['metadata']['skipped_pages'], serial['metadata']['skipped_pages'])
+
+    def test_progress_is_reported_per_page(self):
+        progress = []
+        result = parse_statement(BANDHAN_PDF, row_parser=bandhan_rows, progress=lambda *args: progress.append(args))
+        pages = result['metadata']['total_pages']
+        self.assertEqual(progress, [(done, pages) for done in range(pages + 1)])
+
+    def test_row_parser_comes_from_the_registry(self):
+        stream = StatementStream(BANDHAN_PDF)
+        self.assertIsNone(stream.row_parser)
+        stream.identify()
+        self.assertEqual(stream.row_parser.bank_name, 'BANDHAN')
+        self.assertEqual(len(list(stream)), 158)
+
+
+if __name__ == '__main__':
+    unittest.main()
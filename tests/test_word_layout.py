@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from transaction_stream import parse_statement
+from word_layout import WordLayout
+from helpers import YES_CURRENT_PDF, YES_PDF, yes_rows
+
+
+def word(text, x0, top, width=20):
+    return {'text': text, 'x0': x0, 'x1': x0 + width, 'top': top}
+
+
+LAYOUT = WordLayout(
+    columns=['Date', 'Description', 'Amount'],
+    edges=[0, 100, 300],
+    anchor='Date',
+    anchor_pattern=r'^\d{2}/\d{2}/\d{4}$',
+    start_after=r'^Date Description Amount$',
+)
+
+
+class TestWordLayout(unittest.TestCase):
+    def test_centred_date_line_collects_lines_above_and_below(self):
+        words = [
+            word('Date', 10, 50), word('Description', 110, 50), word('Amount', 310, 50),
+            word('UPI/123/', 110, 80), word('From:abc', 150, 80),
+            word('01/04/2025', 10, 90), word('500.00', 310, 90),
+            word('To:xyz', 110, 100),
+            word('02/04/2025', 10, 130), word('CHARGES', 110, 130), word('5.00', 310, 130),
+            word('Page', 110, 400), word('1', 140, 400),
+        ]
+        rows = LAYOUT.rows(words)
+        self.assertEqual(rows, [
+            ['01/04/2025', 'UPI/123/ From:abc\nTo:xyz', '500.00'],
+            ['02/04/2025', 'CHARGES', '5.00'],
+        ])
+
+    def test_following_attach_keeps_wrapped_lines_with_their_date(self):
+        layout = WordLayout(['Date', 'Description'], [0, 100], 'Date', r'^\d{4}-\d{2}-\d{2}$',
+                            attach='following', attach_distance=60)
+        words = [
+            word('2025-07-30', 10, 100), word('RTGS', 110, 100),
+            word('CLOSE', 110, 118), word('BANK', 110, 136), word('LIMITED', 110, 154),
+            word('2025-07-24', 10, 170), word('UPI', 110, 170),
+        ]
+        self.assertEqual(layout.rows(words), [['2025-07-30', 'RTGS\nCLOSE\nBANK\nLIMITED'], ['2025-07-24', 'UPI']])
+
+    def test_no_anchor_no_rows(self):
+        self.assertEqual(LAYOUT.rows([word('Statement', 10, 10)]), [])
+        self.assertEqual(LAYOUT.rows([]), [])
+
+
+@unittest.skipUnless(os.path.exists(YES_PDF) and os.path.exists(YES_CURRENT_PDF), 'sample PDFs not available')
+class TestYesStatements(unittest.TestCase):
+    def test_both_yes_formats(self):
+        retail = parse_statement(YES_PDF, row_parser=yes_rows)
+        current = parse_statement(YES_CURRENT_PDF, row_parser=yes_rows)
+        self.assertEqual(retail['bank_name'], 'YES')
+        self.assertEqual(retail['total_transactions'], 46)
+        self.assertEqual(retail['transactions'][-1]['balance'], '10,824.84')
+        self.assertEqual(current['total_transactions'], 10)
+        self.assertIn('ICICR42025073000531008', current['transactions'][0]['description'])
+
+
+if __name__ == '__main__':
+    unittest.main()